@@ -6,6 +6,12 @@
 # -----------------
 # - No imports from your core app → no circular deps.
 # - Pure matplotlib; caller supplies data (spacings, FoS/util).
+# - Figures are built with matplotlib.figure.Figure directly, not pyplot, so
+#   they are never registered in pyplot's global figure manager and are
+#   garbage-collected normally in long-running servers (no plt.close needed).
+# - On import, the non-GUI "Agg" backend is pinned (unless pyplot was already
+#   imported), so server processes never probe for Tk/Qt. Override with the
+#   SHOTCRETE_MPL_BACKEND environment variable, e.g. SHOTCRETE_MPL_BACKEND=QtAgg.
 # - Functions return a matplotlib Figure for UI layers to render
 #   (e.g., Streamlit st.pyplot(fig)).
 #
@@ -15,23 +21,156 @@
 #   fig = plot_governing_vs_spacing(s_vals, y_vals, design_mode="FOS")
 #   st.pyplot(fig)
 #
+# Caching
+# -------
+# - The *_cached variants memoise whole Figures on hashable (tuple) inputs, so
+#   UI reruns with unchanged data skip figure construction entirely. The cached
+#   Figure is shared between callers: treat it as read-only and do not close it.
+# - In Streamlit you can instead cache at the call site, e.g.
+#       @st.cache_resource(hash_funcs={Figure: id})
+#       def _fig(s_t, y_t, mode): return plot_governing_vs_spacing(s_t, y_t, design_mode=mode)
+# - With SHOTCRETE_REUSE_FIG=1, plot_governing_vs_spacing() keeps one Figure at
+#   module scope and only updates its line data on later calls (set_data +
+#   rescale) instead of rebuilding Figure/Axes/ticks. Off by default, since
+#   callers then all receive the same, mutated Figure; that is also not
+#   thread-safe, so servers rendering from several threads (Streamlit) should
+#   leave it off.
+#
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Mapping, Sequence, Tuple, Union
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import matplotlib
+
+# Pin the backend before anything imports pyplot (never switch a live one)
+if "matplotlib.pyplot" not in sys.modules:
+    matplotlib.use(os.environ.get("SHOTCRETE_MPL_BACKEND", "Agg"), force=False)
 
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 
 
 Number = Union[int, float]
 
+_TAB10 = colormaps["tab10"]
+
+# y-axis label per design mode (the 1.0 threshold line is the same for both)
+_YLABEL = {
+    "LRFD": "Utilisation (≤ 1.0 is OK)",
+    "FOS": "Factor of Safety (≥ 1.0 is OK)",
+}
+
+# Reused governing-vs-spacing figure (only when SHOTCRETE_REUSE_FIG=1)
+_fig_gov: Optional[Figure] = None
+_line_gov: Optional[Line2D] = None
+
+
+def _reuse_figures() -> bool:
+    return os.environ.get("SHOTCRETE_REUSE_FIG", "") == "1"
+
+
+def _ylabel(design_mode: str) -> str:
+    return _YLABEL.get((design_mode or "FOS").upper(), _YLABEL["FOS"])
+
 
-def _validate_xy(x: Sequence[Number], y: Sequence[Number], name: str = "") -> None:
+def _as_float_array(v: Iterable[Number]) -> np.ndarray:
+    # Materialise one-shot iterables (generators) that np.asarray cannot size
+    return np.asarray(v if hasattr(v, "__len__") else list(v), dtype=np.float64)
+
+
+def _coerce_xy(x: Iterable[Number], y: Iterable[Number], name: str = "") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert x/y once to 1-D float64 arrays (no-op for float64 ndarrays) and
+    validate them; matplotlib then plots the arrays without re-converting.
+    """
     if x is None or y is None:
         raise ValueError(f"{name}: x and y must be provided.")
-    if len(x) != len(y):
-        raise ValueError(f"{name}: x and y must be the same length (got {len(x)} vs {len(y)}).")
-    if len(x) < 2:
-        raise ValueError(f"{name}: need at least 2 points to plot (got {len(x)}).")
+    x_arr, y_arr = _as_float_array(x), _as_float_array(y)
+    if x_arr.ndim != 1 or y_arr.ndim != 1:
+        raise ValueError(f"{name}: x and y must be 1-D.")
+    if x_arr.shape != y_arr.shape:
+        raise ValueError(f"{name}: x and y must be the same length (got {x_arr.shape[0]} vs {y_arr.shape[0]}).")
+    if x_arr.shape[0] < 2:
+        raise ValueError(f"{name}: need at least 2 points to plot (got {x_arr.shape[0]}).")
+    return x_arr, y_arr
+
+
+def _coerce_x(x: Iterable[Number], name: str = "") -> np.ndarray:
+    """_coerce_xy() for the x (spacing) array alone."""
+    if x is None:
+        raise ValueError(f"{name}: x must be provided.")
+    x_arr = _as_float_array(x)
+    if x_arr.ndim != 1:
+        raise ValueError(f"{name}: x must be 1-D.")
+    if x_arr.shape[0] < 2:
+        raise ValueError(f"{name}: need at least 2 points to plot (got {x_arr.shape[0]}).")
+    return x_arr
+
+
+def _coerce_modes(
+    spacings_m: np.ndarray,
+    per_mode_values: Union[Mapping[str, Sequence[Number]], np.ndarray],
+    mode_names: Optional[Sequence[str]],
+    name: str,
+) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """
+    Normalise per-mode data to (names, values[n_modes, n_points]) and validate
+    the shape once against 'spacings_m' (already coerced).
+
+    'per_mode_values' is either a mapping {mode name: series} or a 2-D array
+    with one row per entry of 'mode_names'.
+    """
+    if isinstance(per_mode_values, Mapping):
+        names = tuple(per_mode_values.keys())
+        try:
+            values = np.stack([_as_float_array(v) for v in per_mode_values.values()]) if names else None
+        except ValueError:
+            raise ValueError(f"{name}: every per-mode series must match the length of spacings_m.") from None
+    else:
+        if mode_names is None:
+            raise ValueError(f"{name}: mode_names is required when per-mode values are an array.")
+        names = tuple(mode_names)
+        values = np.asarray(per_mode_values, dtype=np.float64)
+
+    n_points = spacings_m.shape[0]
+    if values is None:
+        return names, np.empty((0, n_points))
+    if values.shape != (len(names), n_points):
+        raise ValueError(
+            f"{name}: per-mode values must have shape (n_modes, n_points) = "
+            f"{(len(names), n_points)} (got {values.shape})."
+        )
+    return names, values
+
+
+def _mode_collection(
+    ax: Axes,
+    spacings_m: np.ndarray,
+    mode_names: Sequence[str],
+    per_mode_values: np.ndarray,
+    linewidth: float,
+    alpha: float = 1.0,
+) -> List[Line2D]:
+    """
+    Draw all per-mode series (rows of 'per_mode_values') as one LineCollection
+    (a single batched artist instead of one Line2D per mode) and return proxy
+    handles for the legend.
+    """
+    segs = np.stack(np.broadcast_arrays(spacings_m, per_mode_values), axis=-1)
+    colors = _TAB10(np.arange(len(mode_names)) % 10)
+    ax.add_collection(LineCollection(segs, colors=colors, linewidths=linewidth, alpha=alpha))
+    ax.autoscale_view()
+    return [
+        Line2D([], [], color=color, linewidth=linewidth, alpha=alpha, label=mode_name)
+        for color, mode_name in zip(colors, mode_names)
+    ]
 
 
 def plot_governing_vs_spacing(
@@ -40,7 +179,8 @@ def plot_governing_vs_spacing(
     *,
     design_mode: str = "FOS",
     title: str = "Governing check vs bolt spacing",
-) -> plt.Figure:
+    reuse: Optional[bool] = None,
+) -> Figure:
     """
     Plot a single curve of the governing metric (FoS or Utilisation) vs spacing.
 
@@ -50,36 +190,62 @@ def plot_governing_vs_spacing(
     governing_values: list/array of FoS (≥1 OK) or Utilisation (≤1 OK)
     design_mode     : "FOS" or "LRFD" (only affects axis label)
     title           : figure title
+    reuse           : update the module-level Figure instead of building one;
+                      None (default) follows SHOTCRETE_REUSE_FIG. Pass False
+                      when the caller will modify or hand off the Figure.
 
     Returns
     -------
     matplotlib.figure.Figure
     """
-    _validate_xy(spacings_m, governing_values, "plot_governing_vs_spacing")
+    global _fig_gov, _line_gov
+    spacings_m, governing_values = _coerce_xy(spacings_m, governing_values, "plot_governing_vs_spacing")
+
+    if not (_reuse_figures() if reuse is None else reuse):
+        return _build_governing_figure(spacings_m, governing_values, design_mode, title)[0]
+
+    if _fig_gov is None:
+        _fig_gov, _line_gov = _build_governing_figure(spacings_m, governing_values, design_mode, title)
+        return _fig_gov
 
-    fig, ax = plt.subplots()
-    ax.plot(spacings_m, governing_values, linewidth=2, marker=None)
+    ax = _fig_gov.axes[0]
+    _line_gov.set_data(spacings_m, governing_values)
+    # A caller's set_ylim/set_xlim on an earlier return switched autoscaling off
+    ax.set_autoscale_on(True)
+    ax.relim()
+    ax.autoscale_view()
+    ax.set_ylabel(_ylabel(design_mode))
+    ax.set_title(title)
+    return _fig_gov
+
+
+def _build_governing_figure(
+    spacings_m: Sequence[Number],
+    governing_values: Sequence[Number],
+    design_mode: str,
+    title: str,
+) -> Tuple[Figure, Line2D]:
+    """Build a fresh governing-vs-spacing Figure; returns (fig, governing_line)."""
+    fig = Figure(layout="constrained")
+    ax = fig.subplots()
+    line, = ax.plot(spacings_m, governing_values, linewidth=2, marker=None)
     ax.set_xlabel("Bolt spacing s (m)")
-    if (design_mode or "").upper() == "LRFD":
-        ax.set_ylabel("Utilisation (≤ 1.0 is OK)")
-        ax.axhline(1.0, linestyle="--", linewidth=1)
-    else:
-        ax.set_ylabel("Factor of Safety (≥ 1.0 is OK)")
-        ax.axhline(1.0, linestyle="--", linewidth=1)
+    ax.set_ylabel(_ylabel(design_mode))
+    ax.axhline(1.0, linestyle="--", linewidth=1, color="0.4")
 
     ax.grid(True, which="both", alpha=0.35)
     ax.set_title(title)
-    fig.tight_layout()
-    return fig
+    return fig, line
 
 
 def plot_per_mode_vs_spacing(
     spacings_m: Sequence[Number],
-    per_mode_values: Mapping[str, Sequence[Number]],
+    per_mode_values: Union[Mapping[str, Sequence[Number]], np.ndarray],
     *,
+    mode_names: Optional[Sequence[str]] = None,
     design_mode: str = "FOS",
     title: str = "Per-mode checks vs bolt spacing",
-) -> plt.Figure:
+) -> Figure:
     """
     Plot multiple curves (one per failure mode) vs spacing.
 
@@ -93,7 +259,10 @@ def plot_per_mode_vs_spacing(
           "Punching": [...],
           "DirectShear": [...],
         }
-      All series must match the length of spacings_m.
+      All series must match the length of spacings_m. Alternatively a 2-D
+      array of shape (n_modes, n_points), one row per entry of mode_names
+      (e.g. np.stack(...) of the rows; validated once as a whole).
+    mode_names    : row labels when per_mode_values is an array
     design_mode   : "FOS" or "LRFD" (axis label only)
     title         : figure title
 
@@ -101,40 +270,35 @@ def plot_per_mode_vs_spacing(
     -------
     matplotlib.figure.Figure
     """
-    if not per_mode_values:
+    if len(per_mode_values) == 0:
         raise ValueError("per_mode_values is empty.")
 
-    # Validate each series
-    for mode_name, series in per_mode_values.items():
-        _validate_xy(spacings_m, series, f"plot_per_mode_vs_spacing[{mode_name}]")
+    spacings_m = _coerce_x(spacings_m, "plot_per_mode_vs_spacing")
+    names, values = _coerce_modes(spacings_m, per_mode_values, mode_names, "plot_per_mode_vs_spacing")
 
-    fig, ax = plt.subplots()
-    for mode_name, series in per_mode_values.items():
-        ax.plot(spacings_m, series, linewidth=2, label=mode_name)
+    fig = Figure(layout="constrained")
+    ax = fig.subplots()
+    handles = _mode_collection(ax, spacings_m, names, values, linewidth=2)
 
     ax.set_xlabel("Bolt spacing s (m)")
-    if (design_mode or "").upper() == "LRFD":
-        ax.set_ylabel("Utilisation (≤ 1.0 is OK)")
-        ax.axhline(1.0, linestyle="--", linewidth=1)
-    else:
-        ax.set_ylabel("Factor of Safety (≥ 1.0 is OK)")
-        ax.axhline(1.0, linestyle="--", linewidth=1)
+    ax.set_ylabel(_ylabel(design_mode))
+    ax.axhline(1.0, linestyle="--", linewidth=1, color="0.4")
 
     ax.grid(True, which="both", alpha=0.35)
-    ax.legend(title="Failure mode")
+    ax.legend(handles=handles, title="Failure mode")
     ax.set_title(title)
-    fig.tight_layout()
     return fig
 
 
 def plot_dual_governing_and_mode(
     spacings_m: Sequence[Number],
     governing_values: Sequence[Number],
-    per_mode_values: Mapping[str, Sequence[Number]],
+    per_mode_values: Union[Mapping[str, Sequence[Number]], np.ndarray],
     *,
+    mode_names: Optional[Sequence[str]] = None,
     design_mode: str = "FOS",
     title: str = "Stability overview",
-) -> plt.Figure:
+) -> Figure:
     """
     Convenience plot: governing curve plus faint per-mode curves beneath it.
 
@@ -142,7 +306,10 @@ def plot_dual_governing_and_mode(
     ----------
     spacings_m      : array of s values [m]
     governing_values: array of FoS or Util values
-    per_mode_values : mapping of mode name -> array of values
+    per_mode_values : mapping of mode name -> array of values, or a 2-D array
+                      of shape (n_modes, n_points) with one row per mode_names
+                      entry (the mapping form is converted to this)
+    mode_names      : row labels when per_mode_values is an array
     design_mode     : "FOS" or "LRFD"
     title           : figure title
 
@@ -150,36 +317,149 @@ def plot_dual_governing_and_mode(
     -------
     matplotlib.figure.Figure
     """
-    _validate_xy(spacings_m, governing_values, "plot_dual_governing_and_mode")
-    for mode_name, series in per_mode_values.items():
-        _validate_xy(spacings_m, series, f"plot_dual_governing_and_mode[{mode_name}]")
+    spacings_m, governing_values = _coerce_xy(spacings_m, governing_values, "plot_dual_governing_and_mode")
+    names, values = _coerce_modes(spacings_m, per_mode_values, mode_names, "plot_dual_governing_and_mode")
 
-    fig, ax = plt.subplots()
+    fig = Figure(layout="constrained")
+    ax = fig.subplots()
 
     # Per-mode in background
-    for mode_name, series in per_mode_values.items():
-        ax.plot(spacings_m, series, linewidth=1.5, alpha=0.5, label=mode_name)
+    handles = []
+    if names:
+        handles = _mode_collection(ax, spacings_m, names, values, linewidth=1.5, alpha=0.5)
 
     # Governing on top (thicker line)
-    ax.plot(spacings_m, governing_values, linewidth=2.5, label="Governing", zorder=5)
+    # (next tab10 colour after the modes, as the colour cycle would have given)
+    gov_color = _TAB10(len(names) % 10)
+    handles += ax.plot(spacings_m, governing_values, linewidth=2.5, color=gov_color, label="Governing", zorder=5)
 
     ax.set_xlabel("Bolt spacing s (m)")
-    if (design_mode or "").upper() == "LRFD":
-        ax.set_ylabel("Utilisation (≤ 1.0 is OK)")
-        ax.axhline(1.0, linestyle="--", linewidth=1)
-    else:
-        ax.set_ylabel("Factor of Safety (≥ 1.0 is OK)")
-        ax.axhline(1.0, linestyle="--", linewidth=1)
+    ax.set_ylabel(_ylabel(design_mode))
+    ax.axhline(1.0, linestyle="--", linewidth=1, color="0.4")
 
     ax.grid(True, which="both", alpha=0.35)
-    ax.legend(title="Curves")
+    ax.legend(handles=handles, title="Curves")
     ax.set_title(title)
-    fig.tight_layout()
     return fig
 
 
+def plot_governing_heatmap(
+    spacings_m: Sequence[Number],
+    thicknesses_m: Sequence[Number],
+    governing_grid: Sequence[Sequence[Number]],
+    *,
+    design_mode: str = "FOS",
+    title: str = "Governing check vs spacing and thickness",
+) -> Figure:
+    """
+    Heatmap of the governing metric over a (spacing x thickness) grid, with the
+    1.0 pass/fail contour drawn on top.
+
+    Parameters
+    ----------
+    spacings_m     : 1-D array of s values [m] (grid axis 0)
+    thicknesses_m  : 1-D array of t values [m] (grid axis 1)
+    governing_grid : (len(spacings_m), len(thicknesses_m)) array of FoS or
+                     Utilisation, e.g. check_design_grid(...)["governing"]
+    design_mode    : "FOS" or "LRFD" (colour-bar label only)
+    title          : figure title
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+    """
+    s_arr = _as_float_array(spacings_m)
+    t_arr = _as_float_array(thicknesses_m)
+    grid = np.asarray(governing_grid, dtype=np.float64)
+    if grid.shape != (s_arr.shape[0], t_arr.shape[0]):
+        raise ValueError(
+            f"plot_governing_heatmap: grid shape {grid.shape} does not match "
+            f"(len(spacings), len(thicknesses)) = {(s_arr.shape[0], t_arr.shape[0])}."
+        )
+
+    # Non-finite cells (FoS = inf for zero demand) are left blank
+    z = np.ma.masked_invalid(grid.T)
+
+    fig = Figure(layout="constrained")
+    ax = fig.subplots()
+    mesh = ax.pcolormesh(s_arr, t_arr, z, shading="nearest", cmap="viridis")
+    fig.colorbar(mesh, ax=ax, label=_ylabel(design_mode))
+    if z.count() and z.min() < 1.0 < z.max():
+        ax.contour(s_arr, t_arr, z, levels=[1.0], colors="white", linestyles="--", linewidths=1)
+
+    ax.set_xlabel("Bolt spacing s (m)")
+    ax.set_ylabel("Shotcrete thickness t (m)")
+    ax.set_title(title)
+    return fig
+
+
+# -----------------------------
+# Memoised variants (hashable tuple inputs)
+# -----------------------------
+@lru_cache(maxsize=32)
+def plot_governing_vs_spacing_cached(
+    spacings_t: Tuple[Number, ...],
+    values_t: Tuple[Number, ...],
+    design_mode: str = "FOS",
+    title: str = "Governing check vs bolt spacing",
+) -> Figure:
+    """
+    Cached plot_governing_vs_spacing(). Pass tuples, e.g.
+    plot_governing_vs_spacing_cached(tuple(s_vals), tuple(y_vals), "FOS").
+    The returned Figure is shared across identical calls (read-only).
+    """
+    spacings_m, values = _coerce_xy(spacings_t, values_t, "plot_governing_vs_spacing_cached")
+    # Always a fresh Figure: the module-level reused one would be mutated later
+    return _build_governing_figure(spacings_m, values, design_mode, title)[0]
+
+
+@lru_cache(maxsize=32)
+def plot_per_mode_vs_spacing_cached(
+    spacings_t: Tuple[Number, ...],
+    per_mode_t: Tuple[Tuple[str, Tuple[Number, ...]], ...],
+    design_mode: str = "FOS",
+    title: str = "Per-mode checks vs bolt spacing",
+) -> Figure:
+    """
+    Cached plot_per_mode_vs_spacing(). 'per_mode_t' is the mapping as a tuple of
+    (mode_name, values_tuple) pairs, e.g.
+    tuple((k, tuple(v)) for k, v in per_mode_values.items()).
+    """
+    return plot_per_mode_vs_spacing(
+        spacings_t,
+        dict(per_mode_t),
+        design_mode=design_mode,
+        title=title,
+    )
+
+
+@lru_cache(maxsize=32)
+def plot_dual_governing_and_mode_cached(
+    spacings_t: Tuple[Number, ...],
+    values_t: Tuple[Number, ...],
+    per_mode_t: Tuple[Tuple[str, Tuple[Number, ...]], ...],
+    design_mode: str = "FOS",
+    title: str = "Stability overview",
+) -> Figure:
+    """
+    Cached plot_dual_governing_and_mode(); tuple inputs as for
+    plot_per_mode_vs_spacing_cached().
+    """
+    return plot_dual_governing_and_mode(
+        spacings_t,
+        values_t,
+        dict(per_mode_t),
+        design_mode=design_mode,
+        title=title,
+    )
+
+
 __all__ = [
     "plot_governing_vs_spacing",
     "plot_per_mode_vs_spacing",
     "plot_dual_governing_and_mode",
+    "plot_governing_heatmap",
+    "plot_governing_vs_spacing_cached",
+    "plot_per_mode_vs_spacing_cached",
+    "plot_dual_governing_and_mode_cached",
 ]
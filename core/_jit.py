@@ -0,0 +1,31 @@
+# core/_jit.py
+# ------------------------------------------------------------
+# Optional Numba support for the numeric kernels in core/*.
+#
+# When Numba is installed, functions decorated with ``njit`` from this module
+# are JIT-compiled (and cached to __pycache__ with cache=True). Without Numba
+# the decorator is a no-op and the very same functions run as plain Python,
+# so results are identical either way and Numba stays an optional speed-up.
+#
+# This file has NO imports from other local modules.
+#
+from __future__ import annotations
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit; supports both @njit and @njit(...)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(fn):
+            return fn
+        return decorator
+
+
+__all__ = ["njit", "prange", "HAVE_NUMBA"]
@@ -0,0 +1,86 @@
+# core/_loads_fast.py
+# ------------------------------------------------------------
+# Compiled kernels for the block-weight load models in core/loads.py.
+#
+# Same formulas as block_weight_pyramid / block_weight_flat (and therefore
+# block_weight_shale), decorated with njit(cache=True) so core.sweep's compiled
+# loops can evaluate the panel load per point without a round-trip through
+# Python. They are internal to core/sweep.py: loads.py keeps its own
+# block_weight_*_unchecked Python versions rather than importing these, since
+# a single compiled call from Python is no faster than the plain function.
+#
+# The pyramid kernel takes tan(theta) rather than theta_deg: it is constant
+# over a sweep, so the caller computes it once (loads._tan_theta) instead of
+# once per point.
+#
+# Unlike the public load functions these kernels do NOT validate their
+# inputs: the caller must ensure s > 0, gamma_rock > 0 and (flat block)
+# h_block > 0, as DesignInput and design.check_design_sweep do.
+#
+# Dependencies
+# ------------
+# - core._jit and core.loads (_ONE_THIRD) only.
+#
+from __future__ import annotations
+from typing import Tuple
+
+try:  # pragma: no cover - exercised only when run as a script
+    from ._jit import njit
+    from .loads import _ONE_THIRD
+except ImportError:  # pragma: no cover - fallback for script execution
+    from _jit import njit
+    from loads import _ONE_THIRD
+
+
+@njit(cache=True)
+def _surcharges(
+    s2: float,
+    surcharge_uniform: float,
+    include_shotcrete_self_weight: bool,
+    t_shotcrete: float,
+    gamma_shotcrete: float,
+) -> float:
+    """Uniform surcharge plus optional shotcrete self-weight on the panel [kN]."""
+    # Branch-free (max() compiles to a select), so a sweep mixing zero and
+    # non-zero terms has no data-dependent branches
+    W = max(surcharge_uniform, 0.0) * s2
+    W += include_shotcrete_self_weight * max(t_shotcrete, 0.0) * s2 * gamma_shotcrete
+    return W
+
+
+@njit(cache=True)
+def block_weight_pyramid_kernel(
+    s: float,
+    gamma_rock: float,
+    tan_theta: float,
+    surcharge_uniform: float,
+    include_shotcrete_self_weight: bool,
+    t_shotcrete: float,
+    gamma_shotcrete: float,
+) -> Tuple[float, float]:
+    """Unvalidated block_weight_pyramid, given tan(theta): (W_total_kN, w_uniform_kNpm2)."""
+    s2 = s * s
+    h = 0.5 * s * tan_theta
+    W_total = _ONE_THIRD * s2 * h * gamma_rock
+    W_total += _surcharges(s2, surcharge_uniform, include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete)
+    return W_total, W_total / s2
+
+
+@njit(cache=True)
+def block_weight_flat_kernel(
+    s: float,
+    gamma_rock: float,
+    h_block: float,
+    surcharge_uniform: float,
+    include_shotcrete_self_weight: bool,
+    t_shotcrete: float,
+    gamma_shotcrete: float,
+) -> Tuple[float, float]:
+    """Unvalidated block_weight_flat: (W_total_kN, w_uniform_kNpm2)."""
+    s2 = s * s
+    W_total = s2 * h_block * gamma_rock
+    W_total += _surcharges(s2, surcharge_uniform, include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete)
+    return W_total, W_total / s2
+
+
+__all__ = ["block_weight_pyramid_kernel", "block_weight_flat_kernel"]
@@ -40,16 +40,35 @@
 #   your preferred code detail (critical perimeter offsets).
 # - Adhesion uses a perimeter ring; if you want full-area bond, set a_bond=s/2.
 #
+# Performance
+# -----------
+# - Every function here is plain scalar maths and is decorated with
+#   njit(cache=True). With Numba installed they compile on first call;
+#   without it they run as ordinary Python (see core/_jit.py).
+# - _check_all_modes() evaluates all four modes for one spacing in a single
+#   compiled call, which is what design.check_design() uses.
+# - Each capacity_* has a *_kNpm2 twin taking strengths already scaled to
+#   kN/m^2 (MaterialProps.*_kNpm2); the MPa versions are thin wrappers.
+# - The public functions guard their inputs; the driver instead uses
+#   unguarded _capacity_* / _*_demand kernels whose preconditions are
+#   established once per design by the caller.
+#
 from __future__ import annotations
 from math import isfinite
 from typing import Tuple
 
+try:  # pragma: no cover - exercised only when run as a script
+    from ._jit import njit
+except ImportError:  # pragma: no cover - fallback for script execution
+    from _jit import njit
+
 MPA_TO_KN_M2 = 1000.0  # 1 MPa = 1000 kN/m^2
 
 
 # ------------------------------------------------------------
 # 1) ADHESION (BOND) FAILURE
 # ------------------------------------------------------------
+@njit(cache=True)
 def capacity_adhesion(s: float, a_bond: float, tau_b_MPa: float) -> float:
     """
     Adhesion (bond) capacity as a resultant force [kN] that can be compared
@@ -76,15 +95,24 @@ def capacity_adhesion(s: float, a_bond: float, tau_b_MPa: float) -> float:
     - 1995 often discussed 30–50 mm adhesive length; 2017 cautions this can be
       outdated. Treat 'a_bond' as a calibrated parameter from site practice.
     """
-    if s <= 0 or a_bond < 0 or tau_b_MPa < 0:
+    return capacity_adhesion_kNpm2(s, a_bond, tau_b_MPa * MPA_TO_KN_M2)
+
+
+@njit(cache=True)
+def capacity_adhesion_kNpm2(s: float, a_bond: float, tau_b_kNpm2: float) -> float:
+    """
+    capacity_adhesion() with the bond strength already in kN/m^2
+    (e.g. MaterialProps.tau_b_kNpm2), so no unit conversion is done here.
+    """
+    if s <= 0 or a_bond < 0 or tau_b_kNpm2 < 0:
         return 0.0
-    A_eff = 4.0 * s * a_bond  # m^2
-    return tau_b_MPa * MPA_TO_KN_M2 * A_eff
+    return _capacity_adhesion(s, a_bond, tau_b_kNpm2)
 
 
 # ------------------------------------------------------------
 # 2) FLEXURE (TWO-WAY SLAB IDEALISATION)
 # ------------------------------------------------------------
+@njit(cache=True)
 def flexure_demands_uniform_load(
     w_kNpm2: float,
     s: float,
@@ -114,10 +142,10 @@ def flexure_demands_uniform_load(
     """
     if s <= 0 or w_kNpm2 < 0:
         return 0.0
-    M_1D = w_kNpm2 * (s ** 2) / 8.0
-    return two_way_factor * M_1D
+    return _flexure_demand(w_kNpm2, s, two_way_factor)
 
 
+@njit(cache=True)
 def capacity_flexure_two_way(
     t_eff: float,
     f_r_MPa: float,
@@ -142,15 +170,24 @@ def capacity_flexure_two_way(
     M_rd_kNpm : float
         Flexural capacity per metre width [kN·m/m].
     """
-    if t_eff <= 0 or f_r_MPa <= 0:
+    return capacity_flexure_two_way_kNpm2(t_eff, f_r_MPa * MPA_TO_KN_M2)
+
+
+@njit(cache=True)
+def capacity_flexure_two_way_kNpm2(t_eff: float, f_r_kNpm2: float) -> float:
+    """
+    capacity_flexure_two_way() with f_r already in kN/m^2
+    (e.g. MaterialProps.f_r_kNpm2).
+    """
+    if t_eff <= 0 or f_r_kNpm2 <= 0:
         return 0.0
-    Z = (t_eff ** 2) / 6.0  # m^3 per m width
-    return f_r_MPa * MPA_TO_KN_M2 * Z
+    return _capacity_flexure(t_eff, f_r_kNpm2)
 
 
 # ------------------------------------------------------------
 # 3) PUNCHING SHEAR NEAR BOLT/PLATE
 # ------------------------------------------------------------
+@njit(cache=True)
 def punching_demand(
     w_kNpm2: float,
     s: float,
@@ -180,9 +217,10 @@ def punching_demand(
     """
     if s <= 0 or w_kNpm2 < 0:
         return 0.0
-    return w_kNpm2 * (s ** 2) / 4.0
+    return _punching_demand(w_kNpm2, s)
 
 
+@njit(cache=True)
 def capacity_punching(
     t_eff: float,
     c_plate: float,
@@ -213,16 +251,24 @@ def capacity_punching(
     - This mirrors code-style punching checks with a simplified perimeter.
       Adjust u and d rules to match AS/Eurocode details as needed.
     """
-    if t_eff <= 0 or c_plate < 0 or v_rd_MPa <= 0:
+    return capacity_punching_kNpm2(t_eff, c_plate, v_rd_MPa * MPA_TO_KN_M2)
+
+
+@njit(cache=True)
+def capacity_punching_kNpm2(t_eff: float, c_plate: float, v_rd_kNpm2: float) -> float:
+    """
+    capacity_punching() with v_rd already in kN/m^2
+    (e.g. MaterialProps.v_rd_kNpm2).
+    """
+    if t_eff <= 0 or c_plate < 0 or v_rd_kNpm2 <= 0:
         return 0.0
-    d = 0.9 * t_eff
-    u = 4.0 * (c_plate + 0.5 * d)
-    return v_rd_MPa * MPA_TO_KN_M2 * u * d
+    return _capacity_punching(t_eff, c_plate, v_rd_kNpm2)
 
 
 # ------------------------------------------------------------
 # 4) DIRECT (IN-PLANE) SHEAR OF THE PANEL
 # ------------------------------------------------------------
+@njit(cache=True)
 def capacity_direct_shear(
     s: float,
     t_eff: float,
@@ -251,15 +297,24 @@ def capacity_direct_shear(
     -----
     - 1995 observed direct shear rarely governs; included here for completeness.
     """
-    if s <= 0 or t_eff <= 0 or tau_v_MPa <= 0:
+    return capacity_direct_shear_kNpm2(s, t_eff, tau_v_MPa * MPA_TO_KN_M2)
+
+
+@njit(cache=True)
+def capacity_direct_shear_kNpm2(s: float, t_eff: float, tau_v_kNpm2: float) -> float:
+    """
+    capacity_direct_shear() with tau_v already in kN/m^2
+    (e.g. MaterialProps.tau_v_kNpm2).
+    """
+    if s <= 0 or t_eff <= 0 or tau_v_kNpm2 <= 0:
         return 0.0
-    A_v = 4.0 * s * t_eff
-    return tau_v_MPa * MPA_TO_KN_M2 * A_v
+    return _capacity_direct_shear(s, t_eff, tau_v_kNpm2)
 
 
 # ------------------------------------------------------------
 # Utility: evaluate pass/fail in FOS or LRFD
 # ------------------------------------------------------------
+@njit(cache=True)
 def evaluate_fos(capacity: float, demand: float) -> Tuple[float, bool]:
     """
     Factor of Safety and pass/fail.
@@ -272,6 +327,7 @@ def evaluate_fos(capacity: float, demand: float) -> Tuple[float, bool]:
     return fos, fos >= 1.0
 
 
+@njit(cache=True)
 def evaluate_lrfd(capacity: float, demand: float, phi: float, gamma: float) -> Tuple[float, bool]:
     """
     LRFD utilisation and pass/fail.
@@ -297,13 +353,97 @@ def evaluate_lrfd(capacity: float, demand: float, phi: float, gamma: float) -> T
     return U, U <= 1.0
 
 
+# ------------------------------------------------------------
+# Unguarded kernels
+# ------------------------------------------------------------
+# Straight-line formulas without the input guards above. The caller must
+# ensure s > 0 and w, t_eff, a_bond, c_plate and all strengths are >= 0
+# (design.check_design does this once per design, not once per mode); with
+# such inputs they return exactly what the guarded functions return.
+@njit(cache=True)
+def _capacity_adhesion(s: float, a_bond: float, tau_b_kNpm2: float) -> float:
+    A_eff = 4.0 * s * a_bond  # m^2
+    return tau_b_kNpm2 * A_eff
+
+
+@njit(cache=True)
+def _flexure_demand(w_kNpm2: float, s: float, two_way_factor: float) -> float:
+    M_1D = w_kNpm2 * s * s / 8.0
+    return two_way_factor * M_1D
+
+
+@njit(cache=True)
+def _capacity_flexure(t_eff: float, f_r_kNpm2: float) -> float:
+    Z = t_eff * t_eff / 6.0  # m^3 per m width
+    return f_r_kNpm2 * Z
+
+
+@njit(cache=True)
+def _punching_demand(w_kNpm2: float, s: float) -> float:
+    return w_kNpm2 * s * s / 4.0
+
+
+@njit(cache=True)
+def _capacity_punching(t_eff: float, c_plate: float, v_rd_kNpm2: float) -> float:
+    d = 0.9 * t_eff
+    u = 4.0 * (c_plate + 0.5 * d)
+    return v_rd_kNpm2 * u * d
+
+
+@njit(cache=True)
+def _capacity_direct_shear(s: float, t_eff: float, tau_v_kNpm2: float) -> float:
+    A_v = 4.0 * s * t_eff
+    return tau_v_kNpm2 * A_v
+
+
+# ------------------------------------------------------------
+# Driver: all four modes in one call
+# ------------------------------------------------------------
+@njit(cache=True)
+def _check_all_modes(
+    s: float,
+    a_bond: float,
+    tau_b_kNpm2: float,
+    w_kNpm2: float,
+    t_eff: float,
+    f_r_kNpm2: float,
+    c_plate: float,
+    v_rd_kNpm2: float,
+    tau_v_kNpm2: float,
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Capacities and demands for all four failure modes at one spacing.
+    Strengths are in kN/m^2 (MaterialProps.*_kNpm2).
+
+    Uses the unguarded kernels, so inputs must satisfy their preconditions
+    (see design._kernel_inputs, which clamps them once per design).
+
+    Returns
+    -------
+    (C_adh_kN, M_dem_kNpm, M_cap_kNpm, V_dem_kN, V_cap_kN, V_shear_kN)
+      Adhesion and direct shear are compared against the panel resultant
+      W_total, which the caller already holds, so no demand is returned for them.
+    """
+    C_adh = _capacity_adhesion(s, a_bond, tau_b_kNpm2)
+    M_dem = _flexure_demand(w_kNpm2, s, 0.6)
+    M_cap = _capacity_flexure(t_eff, f_r_kNpm2)
+    V_dem = _punching_demand(w_kNpm2, s)
+    V_cap = _capacity_punching(t_eff, c_plate, v_rd_kNpm2)
+    V_shear = _capacity_direct_shear(s, t_eff, tau_v_kNpm2)
+    return C_adh, M_dem, M_cap, V_dem, V_cap, V_shear
+
+
 __all__ = [
     "capacity_adhesion",
+    "capacity_adhesion_kNpm2",
     "flexure_demands_uniform_load",
     "capacity_flexure_two_way",
+    "capacity_flexure_two_way_kNpm2",
     "punching_demand",
     "capacity_punching",
+    "capacity_punching_kNpm2",
     "capacity_direct_shear",
+    "capacity_direct_shear_kNpm2",
     "evaluate_fos",
     "evaluate_lrfd",
 ]
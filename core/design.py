@@ -12,7 +12,10 @@
 #   circular imports.
 #
 from __future__ import annotations
-from typing import Tuple, Dict
+from functools import lru_cache
+from typing import Callable, Tuple, Dict
+
+import numpy as np
 
 # When imported as part of the ``core`` package the relative imports below work
 # as intended.  However, running ``design.py`` as a standalone script (or from
@@ -27,50 +30,74 @@ try:  # pragma: no cover - exercised only when run as a script
     from .models import (
         DesignInput,
         DesignResult,
-        ModeResult,
+        ModeBundle,
+        MODE_NAMES,
         DesignMode,
         LoadModel,
     )
     from .loads import (
-        block_weight_pyramid,
-        block_weight_flat,
-        block_weight_shale,
+        _tan_theta,
+        block_weight_pyramid_unchecked,
+        block_weight_flat_unchecked,
+        block_weight_pyramid_vec,
+        block_weight_flat_vec,
+        block_weight_shale_vec,
         uniform_load_from_block,
     )
     from .capacities import (
-        capacity_adhesion,
-        flexure_demands_uniform_load,
-        capacity_flexure_two_way,
-        punching_demand,
-        capacity_punching,
-        capacity_direct_shear,
+        capacity_flexure_two_way_kNpm2,
+        capacity_punching_kNpm2,
+        _check_all_modes,
         evaluate_fos,
         evaluate_lrfd,
     )
+    from .sweep import (
+        sweep_fos,
+        sweep_fos_parallel,
+        make_sweep_kernel,
+        PARALLEL_MIN_POINTS,
+        LOAD_PYRAMID,
+        LOAD_FLAT,
+        MODE_FOS,
+        MODE_LRFD,
+    )
+    from ._jit import HAVE_NUMBA
 except ImportError:  # pragma: no cover - fallback for script execution
     from models import (
         DesignInput,
         DesignResult,
-        ModeResult,
+        ModeBundle,
+        MODE_NAMES,
         DesignMode,
         LoadModel,
     )
     from loads import (
-        block_weight_pyramid,
-        block_weight_flat,
-        block_weight_shale,
+        _tan_theta,
+        block_weight_pyramid_unchecked,
+        block_weight_flat_unchecked,
+        block_weight_pyramid_vec,
+        block_weight_flat_vec,
+        block_weight_shale_vec,
         uniform_load_from_block,
     )
     from capacities import (
-        capacity_adhesion,
-        flexure_demands_uniform_load,
-        capacity_flexure_two_way,
-        punching_demand,
-        capacity_punching,
-        capacity_direct_shear,
+        capacity_flexure_two_way_kNpm2,
+        capacity_punching_kNpm2,
+        _check_all_modes,
         evaluate_fos,
         evaluate_lrfd,
     )
+    from sweep import (
+        sweep_fos,
+        sweep_fos_parallel,
+        make_sweep_kernel,
+        PARALLEL_MIN_POINTS,
+        LOAD_PYRAMID,
+        LOAD_FLAT,
+        MODE_FOS,
+        MODE_LRFD,
+    )
+    from _jit import HAVE_NUMBA
 
 
 # -----------------------------
@@ -80,19 +107,13 @@ def _panel_load_from_input(inp: DesignInput) -> Tuple[float, float]:
     """
     Returns (W_total_kN, w_uniform_kNpm2) for the input geometry/materials.
     By default we do NOT include shotcrete self-weight; toggle below if desired.
+
+    DesignInput has already validated s, gamma_rock, theta_deg and h_block, so
+    the unchecked load functions are used (no per-call guards).
     """
     include_sc = False  # keep load from ground dominant and comparable to papers
-    if inp.load_model == LoadModel.PYRAMID_60:
-        return block_weight_pyramid(
-            s=inp.s,
-            gamma_rock=inp.gamma_rock,
-            theta_deg=inp.theta_deg,
-            surcharge_uniform=0.0,
-            include_shotcrete_self_weight=include_sc,
-            t_shotcrete=inp.t,
-        )
-    elif inp.load_model == LoadModel.FLAT_BLOCK:
-        return block_weight_flat(
+    if inp.load_model == LoadModel.FLAT_BLOCK:
+        return block_weight_flat_unchecked(
             s=inp.s,
             gamma_rock=inp.gamma_rock,
             h_block=inp.h_block,
@@ -100,25 +121,16 @@ def _panel_load_from_input(inp: DesignInput) -> Tuple[float, float]:
             include_shotcrete_self_weight=include_sc,
             t_shotcrete=inp.t,
         )
-    elif inp.load_model == LoadModel.SHALE_WEDGE:
-        return block_weight_shale(
-            s=inp.s,
-            gamma_rock=inp.gamma_rock,
-            theta_deg=inp.theta_deg,
-            surcharge_uniform=0.0,
-            include_shotcrete_self_weight=include_sc,
-            t_shotcrete=inp.t,
-        )
-    else:
-        # Fallback to pyramid if unknown
-        return block_weight_pyramid(
-            s=inp.s,
-            gamma_rock=inp.gamma_rock,
-            theta_deg=inp.theta_deg,
-            surcharge_uniform=0.0,
-            include_shotcrete_self_weight=include_sc,
-            t_shotcrete=inp.t,
-        )
+    # Pyramid60 and ShaleWedge share the pyramid geometry (block_weight_shale
+    # delegates to it); unknown models also fall back to the pyramid.
+    return block_weight_pyramid_unchecked(
+        s=inp.s,
+        gamma_rock=inp.gamma_rock,
+        theta_deg=inp.theta_deg,
+        surcharge_uniform=0.0,
+        include_shotcrete_self_weight=include_sc,
+        t_shotcrete=inp.t,
+    )
 
 
 # -----------------------------
@@ -141,160 +153,440 @@ def check_design(inp: DesignInput) -> DesignResult:
     """
     mat = inp.materials
     f   = inp.factors
-    teff = inp.t_effective()
+    teff = inp.t_effective
 
     W_total_kN, w_uniform = _panel_load_from_input(inp)
 
-    # -------------------------
-    # 1) Adhesion
-    # -------------------------
-    C_adh_kN = capacity_adhesion(s=inp.s, a_bond=inp.a_bond, tau_b_MPa=mat.tau_b)
-    D_adh_kN = W_total_kN  # compare resultant-to-resultant
-    res_adh = _evaluate_mode(
-        name="Adhesion",
-        demand=D_adh_kN,
-        capacity=C_adh_kN,
-        mode=f.mode,
-        phi=f.phi_shear,  # conservative pick (no explicit phi_adh; use shear)
-        gamma=f.gamma_load,
-        detail=f"Ring area 4*s*a_bond; tau_b={mat.tau_b:.3f} MPa, a_bond={inp.a_bond:.3f} m",
-    )
-
-    # -------------------------
-    # 2) Flexure (two-way slab idealisation)
-    # -------------------------
-    M_dem = flexure_demands_uniform_load(
-        w_kNpm2=w_uniform,
-        s=inp.s,
-        two_way_factor=0.6,  # starter coefficient; refine via codes as needed
-    )
-    M_cap = capacity_flexure_two_way(
-        t_eff=teff,
-        f_r_MPa=mat.f_r,
-    )
-    res_flex = _evaluate_mode(
-        name="Flexure",
-        demand=M_dem,
-        capacity=M_cap,
-        mode=f.mode,
-        phi=f.phi_flexure,
-        gamma=f.gamma_load,
-        detail=f"M_1D=w*s^2/8; two-way=0.6; f_r={mat.f_r:.3f} MPa; t_eff={teff:.3f} m",
+    # All four capacity/demand evaluations in one (compiled) call
+    a_bond, tau_b, _, f_r, c, v_rd, tau_v = _kernel_inputs(inp)
+    C_adh_kN, M_dem, M_cap, V_dem, V_cap, Vrd_shear = _check_all_modes(
+        inp.s, a_bond, tau_b, max(0.0, w_uniform), teff, f_r, c, v_rd, tau_v,
     )
 
     # -------------------------
-    # 3) Punching shear (around plate)
+    # Per-mode demand / capacity (rows in MODE_NAMES)
+    #   1) Adhesion:    resultant-to-resultant, W_total vs bond ring
+    #   2) Flexure:     two-way slab idealisation (two-way factor 0.6)
+    #   3) Punching:    shear around plate at one bolt
+    #   4) DirectShear: panel resultant vs in-plane shear
     # -------------------------
-    V_dem = punching_demand(w_kNpm2=w_uniform, s=inp.s)
-    V_cap = capacity_punching(t_eff=teff, c_plate=inp.c, v_rd_MPa=mat.v_rd)
-    res_punch = _evaluate_mode(
-        name="Punching",
-        demand=V_dem,
-        capacity=V_cap,
-        mode=f.mode,
-        phi=f.phi_punching,
-        gamma=f.gamma_load,
-        detail=f"u=4*(c+0.5d); d≈0.9*t_eff; v_rd={mat.v_rd:.3f} MPa; c={inp.c:.3f} m",
+    demands = (W_total_kN, M_dem, V_dem, W_total_kN)
+    capacities = (C_adh_kN, M_cap, V_cap, Vrd_shear)
+    # Adhesion has no explicit phi; the shear factor is the conservative pick
+    phis = (f.phi_shear, f.phi_flexure, f.phi_punching, f.phi_shear)
+    details = (
+        f"Ring area 4*s*a_bond; tau_b={mat.tau_b:.3f} MPa, a_bond={inp.a_bond:.3f} m",
+        f"M_1D=w*s^2/8; two-way=0.6; f_r={mat.f_r:.3f} MPa; t_eff={teff:.3f} m",
+        f"u=4*(c+0.5d); d≈0.9*t_eff; v_rd={mat.v_rd:.3f} MPa; c={inp.c:.3f} m",
+        f"A_v≈4*s*t_eff; tau_v={mat.tau_v:.3f} MPa; t_eff={teff:.3f} m",
     )
 
-    # -------------------------
-    # 4) Direct in-plane shear (panel)
-    # -------------------------
-    D_shear = W_total_kN  # resultant shear equivalent from panel load
-    Vrd_shear = capacity_direct_shear(s=inp.s, t_eff=teff, tau_v_MPa=mat.tau_v)
-    res_shear = _evaluate_mode(
-        name="DirectShear",
-        demand=D_shear,
-        capacity=Vrd_shear,
-        mode=f.mode,
-        phi=f.phi_shear,
-        gamma=f.gamma_load,
-        detail=f"A_v≈4*s*t_eff; tau_v={mat.tau_v:.3f} MPa; t_eff={teff:.3f} m",
+    bundle = ModeBundle(
+        names=MODE_NAMES,
+        demand=np.array(demands),
+        capacity=np.array(capacities),
+        fos=np.full(4, np.nan),
+        util=np.full(4, np.nan),
+        passes=np.zeros(4, dtype=bool),
+        details=details,
     )
+    if f.mode == DesignMode.FOS:
+        for i in range(4):
+            _fill_fos(bundle, i, capacities[i], demands[i])
+    else:
+        for i in range(4):
+            _fill_lrfd(bundle, i, capacities[i], demands[i], phis[i], f.gamma_load)
 
     # -------------------------
     # Collate + governing
     # -------------------------
-    result = DesignResult(derived={"t_eff": teff, "W_total_kN": W_total_kN, "w_kNpm2": w_uniform})
-    result.modes = {
-        "Adhesion":    res_adh,
-        "Flexure":     res_flex,
-        "Punching":    res_punch,
-        "DirectShear": res_shear,
-    }
-
     if f.mode == DesignMode.FOS:
         # governing = MIN FoS
-        gov_mode, gov_val = _min_fos_mode(result.modes)
+        gov_mode, gov_val = _min_fos_mode(bundle.fos)
         ok = gov_val >= 1.0
     else:
         # governing = MAX Utilisation
-        gov_mode, gov_val = _max_util_mode(result.modes)
+        gov_mode, gov_val = _max_util_mode(bundle.util)
         ok = gov_val <= 1.0
 
-    result.governing_mode = gov_mode
-    result.governing_value = gov_val
-    result.ok = ok
-    return result
+    return DesignResult(
+        bundle=bundle,
+        governing_mode=gov_mode,
+        governing_value=gov_val,
+        ok=ok,
+        derived={"t_eff": teff, "W_total_kN": W_total_kN, "w_kNpm2": w_uniform},
+    )
 
 
 # -----------------------------
 # Helpers
 # -----------------------------
-def _evaluate_mode(
-    name: str,
-    demand: float,
-    capacity: float,
-    mode: DesignMode,
-    phi: float,
-    gamma: float,
-    detail: str,
-) -> ModeResult:
+def _kernel_inputs(inp: DesignInput) -> Tuple[float, float, float, float, float, float, float]:
+    """
+    Establish the preconditions of the unguarded capacity kernels once per
+    design instead of once per mode call. Returns clamped
+
+        (a_bond, tau_b_kNpm2, t_eff, f_r_kNpm2, c, v_rd_kNpm2, tau_v_kNpm2)
+
+    Negative strengths clamp to 0. A negative a_bond or c zeroes the matching
+    strength, which reproduces the zero capacity the guarded functions return.
+    (t_eff is already >= 0; s > 0 is enforced by the load models.)
+    """
+    mat = inp.materials
+    return (
+        max(0.0, inp.a_bond),
+        max(0.0, mat.tau_b_kNpm2) if inp.a_bond >= 0.0 else 0.0,
+        inp.t_effective,
+        max(0.0, mat.f_r_kNpm2),
+        max(0.0, inp.c),
+        max(0.0, mat.v_rd_kNpm2) if inp.c >= 0.0 else 0.0,
+        max(0.0, mat.tau_v_kNpm2),
+    )
+
+
+def _fill_fos(bundle: ModeBundle, i: int, capacity: float, demand: float) -> None:
+    """
+    capacities.evaluate_fos for mode 'i', written straight into
+    bundle.fos[i] / bundle.passes[i].
+    """
+    bundle.fos[i], bundle.passes[i] = evaluate_fos(capacity, demand)
+
+
+def _fill_lrfd(bundle: ModeBundle, i: int, capacity: float, demand: float, phi: float, gamma: float) -> None:
+    """
+    capacities.evaluate_lrfd for mode 'i', written straight into
+    bundle.util[i] / bundle.passes[i].
+    """
+    bundle.util[i], bundle.passes[i] = evaluate_lrfd(capacity, demand, phi, gamma)
+
+
+def _min_fos_mode(fos: np.ndarray) -> Tuple[str, float]:
+    """
+    Find the mode with the smallest FoS (FOS design); 'fos' holds one value
+    per mode in MODE_NAMES order. Returns ('ModeName', min_fos_value).
+    """
+    i = int(np.argmin(fos))
+    return MODE_NAMES[i], float(fos[i])
+
+
+def _max_util_mode(util: np.ndarray) -> Tuple[str, float]:
+    """
+    Find the mode with the largest utilisation (LRFD design); 'util' holds one
+    value per mode in MODE_NAMES order. Returns ('ModeName', max_util_value).
+    """
+    i = int(np.argmax(util))
+    return MODE_NAMES[i], float(util[i])
+
+
+# -----------------------------
+# Vectorised spacing sweep
+# -----------------------------
+# The helpers below mirror the scalar capacity/demand functions (including
+# their guard semantics) but accept an ndarray of spacings, so a full sweep is
+# evaluated in a handful of NumPy passes instead of one check_design() per s.
+def _validate_spacings(s: np.ndarray) -> None:
+    """Same check as the scalar load models, for every spacing."""
+    if np.any(s <= 0.0):
+        raise ValueError("Bolt spacing 's' must be > 0.")
+
+
+def _panel_load_from_input_v(inp: DesignInput, s: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorised counterpart of _panel_load_from_input: (W_total_kN, w_uniform_kNpm2)
+    arrays for every spacing in 's'. Shotcrete self-weight and surcharge are
+    excluded, as in the scalar path.
+    """
+    if inp.load_model == LoadModel.FLAT_BLOCK:
+        return block_weight_flat_vec(s, inp.gamma_rock, inp.h_block)
+    if inp.load_model == LoadModel.SHALE_WEDGE:
+        return block_weight_shale_vec(s, inp.gamma_rock, inp.theta_deg)
+    # Pyramid60 and the unknown-model fallback
+    return block_weight_pyramid_vec(s, inp.gamma_rock, inp.theta_deg)
+
+
+def _capacity_adhesion_v(s: np.ndarray, a_bond: float, tau_b_kNpm2: float) -> np.ndarray:
+    """Vectorised capacity_adhesion_kNpm2 [kN]."""
+    if a_bond < 0 or tau_b_kNpm2 < 0:
+        return np.zeros_like(s)
+    return np.where(s > 0, tau_b_kNpm2 * 4.0 * s * a_bond, 0.0)
+
+
+def _flexure_demand_v(w_kNpm2: np.ndarray, s: np.ndarray, two_way_factor: float = 0.6) -> np.ndarray:
+    """Vectorised flexure_demands_uniform_load [kN·m/m]."""
+    return np.where((s > 0) & (w_kNpm2 >= 0), two_way_factor * w_kNpm2 * s * s / 8.0, 0.0)
+
+
+def _punching_demand_v(w_kNpm2: np.ndarray, s: np.ndarray) -> np.ndarray:
+    """Vectorised punching_demand [kN]."""
+    return np.where((s > 0) & (w_kNpm2 >= 0), w_kNpm2 * s * s / 4.0, 0.0)
+
+
+def _capacity_flexure_v(t_eff: np.ndarray, f_r_kNpm2: float) -> np.ndarray:
+    """Vectorised capacity_flexure_two_way_kNpm2 [kN·m/m]."""
+    if f_r_kNpm2 <= 0:
+        return np.zeros_like(t_eff)
+    return np.where(t_eff > 0, f_r_kNpm2 * t_eff * t_eff / 6.0, 0.0)
+
+
+def _capacity_punching_v(t_eff: np.ndarray, c_plate: float, v_rd_kNpm2: float) -> np.ndarray:
+    """Vectorised capacity_punching_kNpm2 [kN]."""
+    if c_plate < 0 or v_rd_kNpm2 <= 0:
+        return np.zeros_like(t_eff)
+    d = 0.9 * t_eff
+    return np.where(t_eff > 0, v_rd_kNpm2 * 4.0 * (c_plate + 0.5 * d) * d, 0.0)
+
+
+def _capacity_direct_shear_v(s: np.ndarray, t_eff, tau_v_kNpm2: float) -> np.ndarray:
+    """Vectorised capacity_direct_shear_kNpm2 [kN]; 't_eff' may be an array broadcasting against 's'."""
+    if tau_v_kNpm2 <= 0:
+        return np.zeros(np.broadcast(s, t_eff).shape)
+    return np.where((s > 0) & (t_eff > 0), tau_v_kNpm2 * 4.0 * s * t_eff, 0.0)
+
+
+def _fos_v(capacity: np.ndarray, demand: np.ndarray) -> np.ndarray:
+    """
+    Vectorised evaluate_fos (FoS only; pass/fail is FoS >= 1). NumPy-path
+    mirror of the scalar guards in capacities.evaluate_fos; keep them in step.
+    """
+    capacity, demand = np.broadcast_arrays(capacity, demand)
+    safe_dem = np.where(demand > 0, demand, 1.0)
+    fos = np.where(capacity > 0, capacity / safe_dem, 0.0)
+    return np.where(demand > 0, fos, np.inf)
+
+
+def _util_v(capacity: np.ndarray, demand: np.ndarray, phi: float, gamma: float) -> np.ndarray:
+    """
+    Vectorised evaluate_lrfd (utilisation only; pass/fail is U <= 1). NumPy-path
+    mirror of the scalar guards in capacities.evaluate_lrfd; keep them in step.
+    """
+    capacity, demand = np.broadcast_arrays(capacity, demand)
+    denominator = phi * capacity
+    ok = (capacity > 0) & (denominator > 0)
+    util = gamma * np.maximum(demand, 0.0) / np.where(ok, denominator, 1.0)
+    return np.where(ok, util, np.inf)
+
+
+def _sweep_params(inp: DesignInput) -> Tuple[float, ...]:
+    """Flatten a DesignInput into the sweep_fos() params tuple (SWEEP_PARAMS order)."""
+    f = inp.factors
+    a_bond, tau_b, teff, f_r, c, v_rd, tau_v = _kernel_inputs(inp)
+    return (
+        float(a_bond), float(tau_b), float(inp.gamma_rock),
+        float(_tan_theta(inp.theta_deg)), float(inp.h_block), float(teff), float(c),
+        float(f_r), float(v_rd), float(tau_v),
+        float(f.phi_flexure), float(f.phi_shear), float(f.phi_punching), float(f.gamma_load),
+        float(LOAD_FLAT if inp.load_model == LoadModel.FLAT_BLOCK else LOAD_PYRAMID),
+        float(MODE_FOS if f.mode == DesignMode.FOS else MODE_LRFD),
+    )
+
+
+def _sweep_numpy(
+    inp: DesignInput,
+    s: np.ndarray,
+    W_total: np.ndarray,
+    w_uniform: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """NumPy implementation of sweep_fos(), used when Numba is not installed."""
+    mat = inp.materials
+    teff = inp.t_effective
+
+    caps = (
+        _capacity_adhesion_v(s, inp.a_bond, mat.tau_b_kNpm2),
+        capacity_flexure_two_way_kNpm2(teff, mat.f_r_kNpm2),
+        capacity_punching_kNpm2(teff, inp.c, mat.v_rd_kNpm2),
+        _capacity_direct_shear_v(s, teff, mat.tau_v_kNpm2),
+    )
+    dems = (
+        W_total,
+        _flexure_demand_v(w_uniform, s, two_way_factor=0.6),
+        _punching_demand_v(w_uniform, s),
+        W_total,
+    )
+
+    return _reduce_modes(inp, caps, dems)
+
+
+def _reduce_modes(
+    inp: DesignInput,
+    caps: Tuple[np.ndarray, ...],
+    dems: Tuple[np.ndarray, ...],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    FoS/utilisation per mode, stacked along a new leading axis (MODE_NAMES),
+    and the governing reduction over it. caps/dems may be any mutually
+    broadcastable shapes; returns (governing, values[4, ...], governing_idx).
+    """
+    f = inp.factors
+    if f.mode == DesignMode.FOS:
+        per_mode = [_fos_v(cap, dem) for cap, dem in zip(caps, dems)]
+    else:
+        phis = (f.phi_shear, f.phi_flexure, f.phi_punching, f.phi_shear)
+        per_mode = [_util_v(cap, dem, phi, f.gamma_load) for cap, dem, phi in zip(caps, dems, phis)]
+
+    values = np.stack(np.broadcast_arrays(*per_mode))
+    gov_idx = np.argmin(values, axis=0) if f.mode == DesignMode.FOS else np.argmax(values, axis=0)
+    governing = np.take_along_axis(values, gov_idx[None], axis=0)[0]
+    return governing, values, gov_idx
+
+
+def check_design_sweep(inp: DesignInput, s_array: np.ndarray) -> Dict[str, object]:
     """
-    Build a ModeResult with either FoS or LRFD utilisation filled in.
+    Evaluate the governing check for every spacing in 's_array' in one pass.
+    All other inputs are taken from 'inp' (inp.s is ignored).
+
+    Results match calling check_design() once per spacing, but without building
+    a DesignInput/DesignResult per point. With Numba installed the fused
+    core.sweep.sweep_fos kernel is used (its prange variant from
+    PARALLEL_MIN_POINTS spacings); otherwise a vectorised NumPy path.
+
+    Returns
+    -------
+    dict with
+      "s"              : 1-D float64 array of spacings [m]
+      "governing"      : governing FoS (min) or utilisation (max) per spacing
+      "governing_mode" : array of governing mode names per spacing
+      "per_mode"       : {"Adhesion": array, "Flexure": ..., "Punching": ..., "DirectShear": ...}
+      "W_total_kN", "w_kNpm2": panel load arrays
+
+    The "s"/"governing"/"per_mode" entries feed straight into
+    charts.plots.plot_governing_vs_spacing / plot_per_mode_vs_spacing.
     """
-    mr = ModeResult(demand=demand, capacity=capacity, detail=detail)
-    if mode == DesignMode.FOS:
-        fos, passes = evaluate_fos(capacity, demand)
-        mr.fos = fos
-        mr.passes = passes
+    s = np.ascontiguousarray(s_array, dtype=np.float64)
+    if s.ndim != 1:
+        raise ValueError("s_array must be 1-D.")
+
+    if HAVE_NUMBA:
+        # The kernel evaluates the panel load itself; DesignInput has already
+        # checked the other load inputs, so only the spacing array is left
+        _validate_spacings(s)
+        kernel = sweep_fos_parallel if s.shape[0] >= PARALLEL_MIN_POINTS else sweep_fos
+        governing, values, gov_idx, W_total = kernel(s, _sweep_params(inp))
+        w_uniform = W_total / (s * s)
     else:
-        util, passes = evaluate_lrfd(capacity, demand, phi=phi, gamma=gamma)
-        mr.utilization = util
-        mr.passes = passes
-    return mr
+        # The *_vec load models validate the spacing array
+        W_total, w_uniform = _panel_load_from_input_v(inp, s)
+        governing, values, gov_idx = _sweep_numpy(inp, s, W_total, w_uniform)
+
+    return _sweep_result(s, governing, values, gov_idx, W_total, w_uniform)
 
 
-def _min_fos_mode(modes: Dict[str, ModeResult]) -> Tuple[str, float]:
+def _sweep_result(
+    s: np.ndarray,
+    governing: np.ndarray,
+    values: np.ndarray,
+    gov_idx: np.ndarray,
+    W_total: np.ndarray,
+    w_uniform: np.ndarray,
+) -> Dict[str, object]:
+    """Package sweep arrays into the check_design_sweep() result dict."""
+    return {
+        "s": s,
+        "governing": governing,
+        "governing_mode": np.asarray(MODE_NAMES)[gov_idx],
+        "per_mode": dict(zip(MODE_NAMES, values)),
+        "W_total_kN": W_total,
+        "w_kNpm2": w_uniform,
+    }
+
+
+def build_sweep(inp: DesignInput) -> Callable[[np.ndarray], Dict[str, object]]:
     """
-    Find the mode with the smallest FoS (FOS design).
-    Returns ('ModeName', min_fos_value). If no FoS values exist, returns ('', 0).
+    Return sweep(s_array) -> dict (as check_design_sweep) specialised to 'inp'.
+
+    With Numba installed the returned function runs a kernel compiled with
+    every input except the spacing baked in as a constant
+    (core.sweep.make_sweep_kernel). Kernels are memoised on the flattened
+    input scalars, so a UI that only moves the spacing slider between reruns
+    compiles once and then reuses the kernel; the prange variant is compiled
+    only once a sweep reaches PARALLEL_MIN_POINTS spacings. Without Numba it simply wraps
+    check_design_sweep on 'inp' (frozen, so the inputs are fixed either way).
     """
-    min_name, min_val = "", 0.0
-    first = True
-    for name, mr in modes.items():
-        if mr.fos is None:
-            continue
-        if first or (mr.fos < min_val):
-            min_name, min_val = name, mr.fos
-            first = False
-    return min_name, min_val
-
-
-def _max_util_mode(modes: Dict[str, ModeResult]) -> Tuple[str, float]:
+    if not HAVE_NUMBA:
+        # DesignInput is frozen, so 'inp' itself is a stable snapshot
+        return lambda s_array: check_design_sweep(inp, s_array)
+    return _build_sweep_cached(_sweep_params(inp))
+
+
+@lru_cache(maxsize=16)
+def _build_sweep_cached(params: Tuple[float, ...]) -> Callable[[np.ndarray], Dict[str, object]]:
+    kernels = {False: make_sweep_kernel(params)}
+
+    def sweep(s_array: np.ndarray) -> Dict[str, object]:
+        s = np.ascontiguousarray(s_array, dtype=np.float64)
+        if s.ndim != 1:
+            raise ValueError("s_array must be 1-D.")
+        _validate_spacings(s)
+        parallel = s.shape[0] >= PARALLEL_MIN_POINTS
+        if parallel not in kernels:
+            # Compiled on first use: UI-sized sweeps never need it
+            kernels[parallel] = make_sweep_kernel(params, parallel=True)
+        governing, values, gov_idx, W_total = kernels[parallel](s)
+        return _sweep_result(s, governing, values, gov_idx, W_total, W_total / (s * s))
+
+    return sweep
+
+
+# -----------------------------
+# Vectorised (s, t) grid
+# -----------------------------
+def check_design_grid(s_arr: np.ndarray, t_arr: np.ndarray, inp: DesignInput) -> Dict[str, object]:
     """
-    Find the mode with the largest utilisation (LRFD design).
-    Returns ('ModeName', max_util_value). If no utilisation values exist, returns ('', 0).
+    Evaluate the governing check on the full (spacing x thickness) grid in one
+    vectorised pass, e.g. for contour/heatmap charts. All other inputs are
+    taken from 'inp' (inp.s and inp.t are ignored).
+
+    Spacing runs along axis 0 and nominal thickness along axis 1; each cell
+    matches check_design(replace(inp, s=s_arr[i], t=t_arr[j])). The durability
+    deduction in inp.factors is applied to every thickness.
+
+    Returns
+    -------
+    dict with
+      "s", "t"         : the 1-D spacing [m] and thickness [m] axes
+      "t_eff"          : effective thickness per column [m]
+      "governing"      : (Ns, Nt) governing FoS (min) or utilisation (max)
+      "governing_idx"  : (Ns, Nt) index of the governing mode into "mode_names"
+      "mode_names"     : MODE_NAMES
+      "per_mode"       : {mode name: (Ns, Nt) array}
+
+    "s"/"t"/"governing" feed straight into charts.plots.plot_governing_heatmap.
     """
-    max_name, max_val = "", 0.0
-    first = True
-    for name, mr in modes.items():
-        if mr.utilization is None:
-            continue
-        if first or (mr.utilization > max_val):
-            max_name, max_val = name, mr.utilization
-            first = False
-    return max_name, max_val
-
-
-__all__ = ["check_design"]
+    s = np.ascontiguousarray(s_arr, dtype=np.float64)
+    t = np.ascontiguousarray(t_arr, dtype=np.float64)
+    if s.ndim != 1 or t.ndim != 1:
+        raise ValueError("s_arr and t_arr must be 1-D.")
+
+    # Loads depend on s only: (Ns, 1) columns; also validates s, gamma_rock, h_block
+    W_total, w_uniform = _panel_load_from_input_v(inp, s)
+    W_total, w_uniform = W_total[:, None], w_uniform[:, None]
+
+    mat = inp.materials
+    t_eff = np.maximum(t - max(0.0, inp.factors.t_dur_deduction), 0.0)
+    S, T = s[:, None], t_eff[None, :]
+
+    caps = (
+        _capacity_adhesion_v(S, inp.a_bond, mat.tau_b_kNpm2),   # (Ns, 1)
+        _capacity_flexure_v(T, mat.f_r_kNpm2),                   # (1, Nt)
+        _capacity_punching_v(T, inp.c, mat.v_rd_kNpm2),          # (1, Nt)
+        _capacity_direct_shear_v(S, T, mat.tau_v_kNpm2),         # (Ns, Nt)
+    )
+    dems = (
+        W_total,
+        _flexure_demand_v(w_uniform, S, two_way_factor=0.6),
+        _punching_demand_v(w_uniform, S),
+        W_total,
+    )
+    governing, values, gov_idx = _reduce_modes(inp, caps, dems)
+
+    return {
+        "s": s,
+        "t": t,
+        "t_eff": t_eff,
+        "governing": governing,
+        "governing_idx": gov_idx,
+        "mode_names": MODE_NAMES,
+        "per_mode": dict(zip(MODE_NAMES, values)),
+    }
+
+
+__all__ = ["check_design", "check_design_sweep", "check_design_grid", "build_sweep"]
@@ -36,10 +36,34 @@
 #   different face kinematics, you can change only the height function
 #   and keep the rest intact.
 # - Optional surcharge terms can be passed to include water/equipment loads.
+# - Each block_weight_* has a *_vec twin taking an array of spacings, for
+#   spacing sweeps (one NumPy pass instead of one Python call per spacing),
+#   and block_weight_pyramid_into / block_weight_flat_into write the same
+#   results into a caller-owned (N, 2) buffer.
+# - Compiled (Numba) kernels of the same formulas, for use inside other
+#   compiled loops, live in core/_loads_fast.py.
+# - make_panel_load_fn() returns compute_panel_load pre-bound to one set of
+#   inputs, as a function of the spacing only.
 #
 from __future__ import annotations
+from functools import lru_cache
 from math import tan, radians
-from typing import Tuple, Optional
+from typing import Callable, Dict, Tuple, Optional
+
+import numpy as np
+
+
+_ONE_THIRD = 1.0 / 3.0  # pyramid volume factor
+
+
+@lru_cache(maxsize=256)
+def _tan_theta(theta_deg: float) -> float:
+    """tan(theta) for a side angle in degrees, memoised (sweeps hold theta fixed)."""
+    # Deliberately libm tan rather than a polynomial fit: a degree-7 Chebyshev
+    # fit over the 30-80 deg wedge range is only good to ~1e-2 relative (tan
+    # steepens towards 80 deg), and this is evaluated once per call/sweep
+    # anyway (make_panel_load_fn and the compiled sweep hoist it out entirely).
+    return tan(radians(theta_deg))
 
 
 # -----------------------------
@@ -115,22 +139,39 @@ def block_weight_pyramid(
         raise ValueError("Bolt spacing 's' must be > 0.")
     if gamma_rock <= 0.0:
         raise ValueError("gamma_rock must be > 0.")
+    return block_weight_pyramid_unchecked(
+        s, gamma_rock, theta_deg, surcharge_uniform,
+        include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete,
+    )
 
-    h = 0.5 * s * tan(radians(theta_deg))
-    V = (1.0 / 3.0) * (s ** 2) * h  # m^3
+
+def block_weight_pyramid_unchecked(
+    s: float,
+    gamma_rock: float,
+    theta_deg: float = 60.0,
+    surcharge_uniform: float = 0.0,
+    include_shotcrete_self_weight: bool = False,
+    t_shotcrete: float = 0.0,
+    gamma_shotcrete: float = 24.0,
+) -> Tuple[float, float]:
+    """
+    block_weight_pyramid without the input guards. The caller guarantees
+    s > 0 and gamma_rock > 0 (e.g. from a validated DesignInput).
+    """
+    s2 = s * s                      # panel area, m^2
+    h = 0.5 * s * _tan_theta(theta_deg)
+    V = _ONE_THIRD * s2 * h         # m^3
     W_rock = V * gamma_rock         # kN
 
-    # Uniform surcharge over the panel (kN/m^2 * m^2 = kN)
-    W_surcharge = surcharge_uniform * (s ** 2) if surcharge_uniform > 0.0 else 0.0
+    # Uniform surcharge over the panel (kN/m^2 * m^2 = kN); negatives count as 0
+    W_surcharge = max(surcharge_uniform, 0.0) * s2
 
-    # Optional shotcrete self-weight on the panel area
-    W_sc = 0.0
-    if include_shotcrete_self_weight and t_shotcrete > 0.0:
-        V_sc = t_shotcrete * (s ** 2)
-        W_sc = V_sc * gamma_shotcrete
+    # Optional shotcrete self-weight on the panel area (the flag multiplies as 0/1)
+    V_sc = max(t_shotcrete, 0.0) * s2
+    W_sc = include_shotcrete_self_weight * V_sc * gamma_shotcrete
 
     W_total = W_rock + W_surcharge + W_sc
-    w_uniform = uniform_load_from_block(W_total, s)
+    w_uniform = W_total / s2  # = uniform_load_from_block(W_total, s); caller ensures s > 0
     return W_total, w_uniform
 
 
@@ -176,19 +217,36 @@ def block_weight_flat(
         raise ValueError("gamma_rock must be > 0.")
     if h_block <= 0.0:
         raise ValueError("h_block must be > 0.")
+    return block_weight_flat_unchecked(
+        s, gamma_rock, h_block, surcharge_uniform,
+        include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete,
+    )
 
-    V = (s ** 2) * h_block
+
+def block_weight_flat_unchecked(
+    s: float,
+    gamma_rock: float,
+    h_block: float,
+    surcharge_uniform: float = 0.0,
+    include_shotcrete_self_weight: bool = False,
+    t_shotcrete: float = 0.0,
+    gamma_shotcrete: float = 24.0,
+) -> Tuple[float, float]:
+    """
+    block_weight_flat without the input guards. The caller guarantees s > 0,
+    gamma_rock > 0 and h_block > 0 (e.g. from a validated DesignInput).
+    """
+    s2 = s * s
+    V = s2 * h_block
     W_rock = V * gamma_rock
 
-    W_surcharge = surcharge_uniform * (s ** 2) if surcharge_uniform > 0.0 else 0.0
+    W_surcharge = max(surcharge_uniform, 0.0) * s2
 
-    W_sc = 0.0
-    if include_shotcrete_self_weight and t_shotcrete > 0.0:
-        V_sc = t_shotcrete * (s ** 2)
-        W_sc = V_sc * gamma_shotcrete
+    V_sc = max(t_shotcrete, 0.0) * s2
+    W_sc = include_shotcrete_self_weight * V_sc * gamma_shotcrete
 
     W_total = W_rock + W_surcharge + W_sc
-    w_uniform = uniform_load_from_block(W_total, s)
+    w_uniform = W_total / s2  # = uniform_load_from_block(W_total, s); caller ensures s > 0
     return W_total, w_uniform
 
 
@@ -224,6 +282,161 @@ def block_weight_shale(
     )
 
 
+# -----------------------------
+# Vectorised variants (array of spacings)
+# -----------------------------
+# Same formulas, guards and defaults as the scalar functions above, but 's' is
+# an ndarray and the results are (W_total_kN, w_uniform_kNpm2) arrays of the
+# same shape. All other parameters are scalars.
+def _check_spacings_vec(s: np.ndarray, gamma_rock: float) -> np.ndarray:
+    s = np.asarray(s, dtype=np.float64)
+    if np.any(s <= 0.0):
+        raise ValueError("Bolt spacing 's' must be > 0.")
+    if gamma_rock <= 0.0:
+        raise ValueError("gamma_rock must be > 0.")
+    return s
+
+
+def _add_surcharges_vec(
+    W_rock: np.ndarray,
+    s2: np.ndarray,
+    surcharge_uniform: float,
+    include_shotcrete_self_weight: bool,
+    t_shotcrete: float,
+    gamma_shotcrete: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Add the optional surcharge/self-weight terms and return (W_total, w_uniform)."""
+    # Same branch-free terms as the scalar models (negatives count as 0, the
+    # flag multiplies as 0/1)
+    W_surcharge = max(surcharge_uniform, 0.0) * s2
+    W_sc = include_shotcrete_self_weight * (max(t_shotcrete, 0.0) * s2) * gamma_shotcrete
+    W_total = W_rock + W_surcharge + W_sc
+    return W_total, W_total / s2
+
+
+def block_weight_pyramid_vec(
+    s: np.ndarray,
+    gamma_rock: float,
+    theta_deg: float = 60.0,
+    surcharge_uniform: float = 0.0,
+    include_shotcrete_self_weight: bool = False,
+    t_shotcrete: float = 0.0,
+    gamma_shotcrete: float = 24.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised block_weight_pyramid over an array of spacings 's'."""
+    s = _check_spacings_vec(s, gamma_rock)
+    s2 = s * s
+    h = 0.5 * s * _tan_theta(theta_deg)
+    V = _ONE_THIRD * s2 * h  # m^3
+    return _add_surcharges_vec(
+        V * gamma_rock, s2, surcharge_uniform,
+        include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete,
+    )
+
+
+def block_weight_flat_vec(
+    s: np.ndarray,
+    gamma_rock: float,
+    h_block: float,
+    surcharge_uniform: float = 0.0,
+    include_shotcrete_self_weight: bool = False,
+    t_shotcrete: float = 0.0,
+    gamma_shotcrete: float = 24.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised block_weight_flat over an array of spacings 's'."""
+    s = _check_spacings_vec(s, gamma_rock)
+    if h_block <= 0.0:
+        raise ValueError("h_block must be > 0.")
+    s2 = s * s
+    V = s2 * h_block
+    return _add_surcharges_vec(
+        V * gamma_rock, s2, surcharge_uniform,
+        include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete,
+    )
+
+
+def block_weight_shale_vec(
+    s: np.ndarray,
+    gamma_rock: float,
+    theta_deg: float,
+    surcharge_uniform: float = 0.0,
+    include_shotcrete_self_weight: bool = False,
+    t_shotcrete: float = 0.0,
+    gamma_shotcrete: float = 24.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised block_weight_shale (same geometry as the pyramid)."""
+    return block_weight_pyramid_vec(
+        s, gamma_rock, theta_deg, surcharge_uniform,
+        include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete,
+    )
+
+
+# -----------------------------
+# Buffer variants (write into a preallocated array)
+# -----------------------------
+# For repeated sweeps that reuse one output buffer: 'out' is an (N, 2) float64
+# array for N spacings and receives W_total_kN in column 0 and w_uniform_kNpm2
+# in column 1, with no temporaries allocated. Same guards as the *_vec twins.
+def _surcharge_per_area(
+    surcharge_uniform: float,
+    include_shotcrete_self_weight: bool,
+    t_shotcrete: float,
+    gamma_shotcrete: float,
+) -> float:
+    """Surcharge plus optional shotcrete self-weight per unit panel area [kN/m^2]."""
+    return (max(surcharge_uniform, 0.0)
+            + include_shotcrete_self_weight * max(t_shotcrete, 0.0) * gamma_shotcrete)
+
+
+def _panel_load_into(out: np.ndarray, s: np.ndarray, k_lin: float, k_const: float) -> None:
+    """out[:, 1] = w = k_lin * s + k_const;  out[:, 0] = W = w * s^2."""
+    if out.shape != (s.shape[0], 2):
+        raise ValueError(f"'out' must have shape ({s.shape[0]}, 2), got {out.shape}.")
+    W, w = out[:, 0], out[:, 1]
+    np.multiply(s, k_lin, out=w)
+    w += k_const
+    np.multiply(s, s, out=W)
+    W *= w
+
+
+def block_weight_pyramid_into(
+    out: np.ndarray,
+    s: np.ndarray,
+    gamma_rock: float,
+    theta_deg: float = 60.0,
+    surcharge_uniform: float = 0.0,
+    include_shotcrete_self_weight: bool = False,
+    t_shotcrete: float = 0.0,
+    gamma_shotcrete: float = 24.0,
+) -> None:
+    """block_weight_pyramid for an array of spacings, written into 'out' (N, 2)."""
+    s = _check_spacings_vec(s, gamma_rock).ravel()
+    # W_rock / s^2 = (1/3) * (s/2) * tan(theta) * gamma_rock
+    k_lin = _ONE_THIRD * 0.5 * _tan_theta(theta_deg) * gamma_rock
+    _panel_load_into(out, s, k_lin, _surcharge_per_area(
+        surcharge_uniform, include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete,
+    ))
+
+
+def block_weight_flat_into(
+    out: np.ndarray,
+    s: np.ndarray,
+    gamma_rock: float,
+    h_block: float,
+    surcharge_uniform: float = 0.0,
+    include_shotcrete_self_weight: bool = False,
+    t_shotcrete: float = 0.0,
+    gamma_shotcrete: float = 24.0,
+) -> None:
+    """block_weight_flat for an array of spacings, written into 'out' (N, 2)."""
+    s = _check_spacings_vec(s, gamma_rock).ravel()
+    if h_block <= 0.0:
+        raise ValueError("h_block must be > 0.")
+    _panel_load_into(out, s, 0.0, h_block * gamma_rock + _surcharge_per_area(
+        surcharge_uniform, include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete,
+    ))
+
+
 # -----------------------------
 # Optional convenience API (pure parameters, no model imports)
 # -----------------------------
@@ -245,7 +458,8 @@ def compute_panel_load(
     Parameters
     ----------
     model : str
-        One of: "Pyramid60", "FlatBlock", "ShaleWedge" (case-insensitive accepted).
+        One of: "Pyramid60", "FlatBlock", "ShaleWedge" (case-insensitive accepted),
+        or a models.LoadModel member (looked up directly, no normalising).
     s, gamma_rock, theta_deg, h_block, surcharge_uniform, include_shotcrete_self_weight,
     t_shotcrete, gamma_shotcrete : see individual functions above.
 
@@ -253,29 +467,112 @@ def compute_panel_load(
     -------
     (W_total_kN, w_uniform_kNpm2)
     """
-    key = (model or "").strip().lower()
-    if key in ("pyramid60", "pyramid", "bm1995", "barrett"):
-        th = 60.0 if theta_deg is None else float(theta_deg)
-        return block_weight_pyramid(
-            s, gamma_rock, th, surcharge_uniform,
-            include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete
-        )
-    elif key in ("flatblock", "flat", "hawkesbury"):
+    fn = _resolve_model(model)
+    return fn(
+        s, gamma_rock, theta_deg, h_block, surcharge_uniform,
+        include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete,
+    )
+
+
+def make_panel_load_fn(
+    model: str,
+    *,
+    gamma_rock: float,
+    theta_deg: Optional[float] = None,
+    h_block: Optional[float] = None,
+    surcharge_uniform: float = 0.0,
+    include_shotcrete_self_weight: bool = False,
+    t_shotcrete: float = 0.0,
+    gamma_shotcrete: float = 24.0,
+) -> Callable[[float], Tuple[float, float]]:
+    """
+    compute_panel_load specialised to everything except the spacing.
+
+    The model lookup, parameter validation and all branches run once here; the
+    returned function panel_load(s) -> (W_total_kN, w_uniform_kNpm2) only
+    evaluates one product per call. Both load models reduce to
+
+        w = k_rock(s) + k_sur,   W = w * s^2
+
+    with k_rock = gamma_rock * tan(theta) / 6 * s (pyramid/shale) or
+    gamma_rock * h_block (flat block), and k_sur the surcharge plus optional
+    shotcrete self-weight per unit area. Results match compute_panel_load to
+    rounding. Use it for UI sweeps that hold the inputs fixed and vary 's'.
+    """
+    fn = _resolve_model(model)
+    if gamma_rock <= 0.0:
+        raise ValueError("gamma_rock must be > 0.")
+
+    k_sur = _surcharge_per_area(
+        surcharge_uniform, include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete
+    )
+
+    if fn is _panel_load_flat:
         if h_block is None:
             raise ValueError("FlatBlock requires h_block (m).")
-        return block_weight_flat(
-            s, gamma_rock, float(h_block), surcharge_uniform,
-            include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete
-        )
-    elif key in ("shalewedge", "shale"):
-        if theta_deg is None:
-            raise ValueError("ShaleWedge requires theta_deg (degrees).")
-        return block_weight_shale(
-            s, gamma_rock, float(theta_deg), surcharge_uniform,
-            include_shotcrete_self_weight, t_shotcrete, gamma_shotcrete
-        )
+        if h_block <= 0.0:
+            raise ValueError("h_block must be > 0.")
+        w_flat = float(h_block) * gamma_rock + k_sur
+
+        def panel_load(s: float) -> Tuple[float, float]:
+            if s <= 0.0:
+                raise ValueError("Bolt spacing 's' must be > 0.")
+            return w_flat * (s * s), w_flat
     else:
-        raise ValueError(f"Unknown load model '{model}'. Expected Pyramid60 | FlatBlock | ShaleWedge.")
+        if fn is _panel_load_shale and theta_deg is None:
+            raise ValueError("ShaleWedge requires theta_deg (degrees).")
+        th = 60.0 if theta_deg is None else float(theta_deg)
+        # W_rock = (1/3) * s^2 * (s/2) * tan(theta) * gamma_rock = k_cube * s^3
+        k_cube = _ONE_THIRD * 0.5 * _tan_theta(th) * gamma_rock
+
+        def panel_load(s: float) -> Tuple[float, float]:
+            if s <= 0.0:
+                raise ValueError("Bolt spacing 's' must be > 0.")
+            w = k_cube * s + k_sur
+            return w * (s * s), w
+
+    return panel_load
+
+
+def _resolve_model(model) -> Callable[..., Tuple[float, float]]:
+    """Dispatch-table adapter for a load model name or LoadModel member."""
+    fn = _MODEL_DISPATCH.get(model)  # exact hit: LoadModel member or canonical name
+    if fn is None:
+        fn = _MODEL_DISPATCH.get((model or "").strip().lower())
+        if fn is None:
+            raise ValueError(f"Unknown load model '{model}'. Expected Pyramid60 | FlatBlock | ShaleWedge.")
+    return fn
+
+
+# Adapters with one uniform signature for compute_panel_load's dispatch table
+def _panel_load_pyramid(s, gamma_rock, theta_deg, h_block, *rest) -> Tuple[float, float]:
+    th = 60.0 if theta_deg is None else float(theta_deg)
+    return block_weight_pyramid(s, gamma_rock, th, *rest)
+
+
+def _panel_load_flat(s, gamma_rock, theta_deg, h_block, *rest) -> Tuple[float, float]:
+    if h_block is None:
+        raise ValueError("FlatBlock requires h_block (m).")
+    return block_weight_flat(s, gamma_rock, float(h_block), *rest)
+
+
+def _panel_load_shale(s, gamma_rock, theta_deg, h_block, *rest) -> Tuple[float, float]:
+    if theta_deg is None:
+        raise ValueError("ShaleWedge requires theta_deg (degrees).")
+    return block_weight_shale(s, gamma_rock, float(theta_deg), *rest)
+
+
+# Model name -> adapter. Holds the canonical LoadModel values (str-valued enum
+# members hash/compare equal to them, so they hit without normalising) plus the
+# lower-case aliases accepted after .strip().lower().
+_MODEL_DISPATCH: Dict[str, Callable[..., Tuple[float, float]]] = {
+    "Pyramid60": _panel_load_pyramid,
+    "FlatBlock": _panel_load_flat,
+    "ShaleWedge": _panel_load_shale,
+    **dict.fromkeys(("pyramid60", "pyramid", "bm1995", "barrett"), _panel_load_pyramid),
+    **dict.fromkeys(("flatblock", "flat", "hawkesbury"), _panel_load_flat),
+    **dict.fromkeys(("shalewedge", "shale"), _panel_load_shale),
+}
 
 
 __all__ = [
@@ -283,5 +580,13 @@ __all__ = [
     "block_weight_pyramid",
     "block_weight_flat",
     "block_weight_shale",
+    "block_weight_pyramid_unchecked",
+    "block_weight_flat_unchecked",
+    "block_weight_pyramid_vec",
+    "block_weight_flat_vec",
+    "block_weight_shale_vec",
+    "block_weight_pyramid_into",
+    "block_weight_flat_into",
     "compute_panel_load",
+    "make_panel_load_fn",
 ]
@@ -18,13 +18,21 @@
 # - Thickness durability deduction (t_dur_deduction) is in metres.
 # - Effective thickness t_eff = max(0, t - t_dur_deduction).
 #
-# This file is purely data containers + tiny helpers.
+# This file is purely data containers + tiny helpers (NumPy is used only for
+# the per-mode result arrays).
 # All calculations live in loads.py / capacities.py / design.py.
 
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional
+from math import isnan
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+# 1 MPa = 1000 kN/m^2 (same constant as capacities.MPA_TO_KN_M2)
+_MPA_TO_KN_M2 = 1000.0
 
 
 # -----------------------------
@@ -50,7 +58,7 @@ class GeologyPreset(str, Enum):
 # -----------------------------
 # Materials & Code Factors
 # -----------------------------
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MaterialProps:
     """
     Material properties for shotcrete and interface, at the selected design age.
@@ -71,6 +79,15 @@ class MaterialProps:
     v_rd  : float
         Design diagonal tension / punching shear stress (MPa)
         (may include fibre contribution if derived via codes.py).
+
+    Derived (set at construction, not init arguments)
+    -------------------------------------------------
+    tau_b_kNpm2, f_r_kNpm2, tau_v_kNpm2, v_rd_kNpm2 : float
+        The same strengths pre-scaled to kN/m^2 for the capacity kernels.
+        Computed once in __post_init__.
+
+    Instances are frozen (and slotted): use dataclasses.replace() to derive a
+    modified copy, which also recomputes the derived fields.
     """
     f_c: float
     tau_b: float
@@ -78,8 +95,20 @@ class MaterialProps:
     tau_v: float
     v_rd: float
 
+    tau_b_kNpm2: float = field(init=False, repr=False, compare=False)
+    f_r_kNpm2: float = field(init=False, repr=False, compare=False)
+    tau_v_kNpm2: float = field(init=False, repr=False, compare=False)
+    v_rd_kNpm2: float = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self) -> None:
+        # frozen: derived fields are set through object.__setattr__
+        object.__setattr__(self, "tau_b_kNpm2", self.tau_b * _MPA_TO_KN_M2)
+        object.__setattr__(self, "f_r_kNpm2", self.f_r * _MPA_TO_KN_M2)
+        object.__setattr__(self, "tau_v_kNpm2", self.tau_v * _MPA_TO_KN_M2)
+        object.__setattr__(self, "v_rd_kNpm2", self.v_rd * _MPA_TO_KN_M2)
+
+
+@dataclass(frozen=True, slots=True)
 class CodeFactors:
     """
     Design factors and durability allowances.
@@ -99,6 +128,8 @@ class CodeFactors:
     t_dur_deduction: float
         Thickness deduction for durability/corrosion (m). 2017 paper recommends
         considering long-term allowances; 0.0 if not applicable.
+
+    Frozen (and slotted): use dataclasses.replace() to change a factor.
     """
     mode: DesignMode = DesignMode.FOS
     phi_flexure: float = 0.6
@@ -111,7 +142,19 @@ class CodeFactors:
 # -----------------------------
 # Design Inputs
 # -----------------------------
-@dataclass
+# Geometry fields DesignInput validates on construction:
+# name -> (predicate, message). core.design relies on these to call the load
+# models without re-checking them per call.
+_INPUT_CHECKS = {
+    "s": (lambda v: v > 0.0, "Bolt spacing 's' must be > 0."),
+    "t": (lambda v: v > 0.0, "Shotcrete thickness 't' must be > 0."),
+    "gamma_rock": (lambda v: v > 0.0, "gamma_rock must be > 0."),
+    "theta_deg": (lambda v: 0.0 < v < 90.0, "theta_deg must be in (0, 90) degrees."),
+    "h_block": (lambda v: v > 0.0, "h_block must be > 0."),
+}
+
+
+@dataclass(frozen=True, slots=True)
 class DesignInput:
     """
     All user-selectable inputs needed to execute the design checks.
@@ -142,6 +185,20 @@ class DesignInput:
     ----
     age_label         : Descriptive label for age (e.g., "Early", "7d", "28d").
     notes             : Free-form string captured into exports for traceability.
+
+    Derived
+    -------
+    t_effective       : Effective thickness after durability deduction (never
+                        negative), m. Computed once in __post_init__.
+
+    Validation
+    ----------
+    s, t, gamma_rock, h_block must be > 0 and 0 < theta_deg < 90; a ValueError
+    is raised on construction. Downstream code (core.design) therefore skips
+    these checks per load evaluation.
+
+    Instances are frozen (and slotted, hence hashable): use dataclasses.replace()
+    to derive a modified copy, which is validated and recomputes t_effective.
     """
     # Geometry
     s: float
@@ -170,16 +227,34 @@ class DesignInput:
     # Adhesive (bond) length parameter (1995 concept; tune with 2017 practice)
     a_bond: float = 0.05  # m; use 0.03–0.05 cautiously per 2017 remarks
 
-    def t_effective(self) -> float:
-        """Effective thickness after durability deduction (never negative)."""
+    # Derived (see class docstring)
+    t_effective: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for name, (ok, message) in _INPUT_CHECKS.items():
+            if not ok(getattr(self, name)):
+                raise ValueError(message)
+        # frozen: derived fields are set through object.__setattr__
         teff = self.t - max(0.0, self.factors.t_dur_deduction)
-        return teff if teff > 0.0 else 0.0
+        object.__setattr__(self, "t_effective", teff if teff > 0.0 else 0.0)
 
 
 # -----------------------------
 # Per-mode & overall results
 # -----------------------------
-@dataclass
+# Fixed order of the failure modes in every per-mode array/tuple
+MODE_NAMES: Tuple[str, str, str, str] = ("Adhesion", "Flexure", "Punching", "DirectShear")
+
+
+class ModeIdx:
+    """Positions of the failure modes in MODE_NAMES / DesignResult.modes."""
+    ADHESION = 0
+    FLEXURE = 1
+    PUNCHING = 2
+    DIRECT_SHEAR = 3
+
+
+@dataclass(frozen=True, slots=True)
 class ModeResult:
     """
     Demand vs capacity for a single failure mode.
@@ -190,6 +265,8 @@ class ModeResult:
     fos        : float | None — Capacity / Demand when in FOS mode.
     utilization: float | None — (γ*Demand) / (φ*Capacity) when in LRFD mode.
     passes     : bool | None — Result of the governing criterion for the selected mode.
+
+    Frozen (and slotted): results are read-only snapshots.
     """
     demand: float
     capacity: float
@@ -199,18 +276,57 @@ class ModeResult:
     detail: str = ""  # free text (e.g., equations used, spans, moments)
 
 
+@dataclass
+class ModeBundle:
+    """
+    Per-mode results stored as parallel arrays (one entry per mode in 'names'),
+    so governing reductions are a single argmin/argmax over contiguous memory.
+
+    names    : tuple of mode names (MODE_NAMES for check_design results)
+    demand   : float64 array — per-mode demand (units as in ModeResult)
+    capacity : float64 array — per-mode capacity
+    fos      : float64 array — FoS per mode; NaN where not evaluated (LRFD mode)
+    util     : float64 array — utilisation per mode; NaN where not evaluated (FOS mode)
+    passes   : bool array — pass/fail per mode
+    details  : tuple of per-mode detail strings
+    """
+    names: Tuple[str, ...]
+    demand: np.ndarray
+    capacity: np.ndarray
+    fos: np.ndarray
+    util: np.ndarray
+    passes: np.ndarray
+    details: Tuple[str, ...] = ()
+
+    def mode_result(self, i: int) -> ModeResult:
+        """Materialise entry 'i' as a ModeResult (NaN → None)."""
+        fos = float(self.fos[i])
+        util = float(self.util[i])
+        has_fos, has_util = not isnan(fos), not isnan(util)
+        return ModeResult(
+            demand=float(self.demand[i]),
+            capacity=float(self.capacity[i]),
+            fos=fos if has_fos else None,
+            utilization=util if has_util else None,
+            passes=bool(self.passes[i]) if (has_fos or has_util) else None,
+            detail=self.details[i] if i < len(self.details) else "",
+        )
+
+
 @dataclass
 class DesignResult:
     """
     Container for all per-mode results and overall governing outcome.
 
-    modes: mapping from mode name → ModeResult, e.g.:
-           {
-             "Adhesion": ModeResult(...),
-             "Flexure":  ModeResult(...),
-             "Punching": ModeResult(...),
-             "DirectShear": ModeResult(...)
-           }
+    bundle: ModeBundle with the per-mode demand/capacity/FoS/utilisation arrays.
+
+    modes: (read-only property) tuple of ModeResult, one per entry of
+           bundle.names — MODE_NAMES order for check_design results, so index
+           with ModeIdx (e.g. result.modes[ModeIdx.FLEXURE]) or iterate with
+           zip(MODE_NAMES, result.modes). Built lazily from 'bundle'.
+    modes_dict / by_name: (read-only properties) the same results as a mapping
+           {"Adhesion": ModeResult(...), "Flexure": ..., "Punching": ..., "DirectShear": ...}
+           for callers that look modes up by name.
 
     governing_mode : which mode controls (min FoS or max utilization).
     governing_value: the controlling value (FoS or utilization).
@@ -218,15 +334,36 @@ class DesignResult:
 
     derived        : convenience numbers (e.g., effective thickness).
     """
-    modes: Dict[str, ModeResult] = field(default_factory=dict)
+    bundle: Optional[ModeBundle] = None
     governing_mode: str = ""
     governing_value: float = 0.0
     ok: bool = False
     derived: Dict[str, float] = field(default_factory=dict)
 
+    _modes: Optional[Tuple[ModeResult, ...]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def modes(self) -> Tuple[ModeResult, ...]:
+        """Per-mode results in bundle order, materialised on first access."""
+        if self._modes is None:
+            b = self.bundle
+            self._modes = () if b is None else tuple(b.mode_result(i) for i in range(len(b.names)))
+        return self._modes
+
+    @property
+    def by_name(self) -> Dict[str, ModeResult]:
+        """Per-mode results as {name: ModeResult}."""
+        names = () if self.bundle is None else self.bundle.names
+        return dict(zip(names, self.modes))
+
+    @property
+    def modes_dict(self) -> Dict[str, ModeResult]:
+        """Alias of by_name (the mapping form 'modes' had before)."""
+        return self.by_name
+
     def summary(self) -> str:
         """One-line human-readable summary."""
-        if not self.modes:
+        if self.bundle is None or not self.bundle.names:
             return "No results."
         gm = self.governing_mode or "N/A"
         val = self.governing_value
@@ -242,6 +379,9 @@ __all__ = [
     "MaterialProps",
     "CodeFactors",
     "DesignInput",
+    "MODE_NAMES",
+    "ModeIdx",
     "ModeResult",
+    "ModeBundle",
     "DesignResult",
 ]
@@ -0,0 +1,238 @@
+# core/sweep.py
+# ------------------------------------------------------------
+# Fused spacing-sweep kernel.
+#
+# sweep_fos() evaluates the panel load, all four capacities/demands,
+# the FoS/utilisation per mode and the governing reduction for every
+# spacing in one loop. With Numba installed the loop is compiled; without it
+# the same code runs as plain Python (see core/_jit.py), so design.py prefers
+# its NumPy path in that case.
+#
+# make_sweep_kernel() compiles the same per-point body into a closure with the
+# inputs baked in as constants, for UIs that re-sweep one design many times.
+#
+# Sweeps of PARALLEL_MIN_POINTS spacings or more can use the prange variants
+# (sweep_fos_parallel, make_sweep_kernel(..., parallel=True)): every iteration
+# only writes its own slot i of the output arrays (no cross-iteration
+# reductions), so Numba splits the loop over worker threads without the GIL.
+# Below that size thread start-up dominates, so callers stay on the serial
+# loop. The thread count defaults to the number of cores; set NUMBA_NUM_THREADS
+# (environment) or call numba.set_num_threads(n) to limit it. With the TBB
+# threading layer a process that ran a parallel kernel from a non-main thread
+# (e.g. a Streamlit script thread) can hang at exit; set
+# NUMBA_THREADING_LAYER=omp or workqueue where large sweeps run off the main
+# thread.
+#
+# Inputs are passed as a flat tuple of floats (no dataclasses/enums) so the
+# kernel stays in Numba's nopython mode. design.py builds that tuple from a
+# DesignInput; see SWEEP_PARAMS for the field order.
+#
+# Dependencies
+# ------------
+# - core.capacities / core._loads_fast (scalar kernels) and core._jit only;
+#   never design.py. Rows of the per-mode output follow models.MODE_NAMES.
+#
+from __future__ import annotations
+from typing import Tuple
+
+import numpy as np
+
+try:  # pragma: no cover - exercised only when run as a script
+    from ._jit import njit, prange
+    from ._loads_fast import block_weight_flat_kernel, block_weight_pyramid_kernel
+    from .capacities import _check_all_modes, evaluate_fos, evaluate_lrfd
+except ImportError:  # pragma: no cover - fallback for script execution
+    from _jit import njit, prange
+    from _loads_fast import block_weight_flat_kernel, block_weight_pyramid_kernel
+    from capacities import _check_all_modes, evaluate_fos, evaluate_lrfd
+
+
+# Integer codes for the enum-valued inputs (Numba cannot take Python enums)
+LOAD_PYRAMID = 0   # Pyramid60 and ShaleWedge share the pyramid geometry
+LOAD_FLAT = 1
+MODE_FOS = 0
+MODE_LRFD = 1
+
+# Field order of the 'params' tuple
+SWEEP_PARAMS = (
+    "a_bond", "tau_b_kNpm2", "gamma_rock", "tan_theta", "h_block", "t_eff", "c",
+    "f_r_kNpm2", "v_rd_kNpm2", "tau_v_kNpm2", "phi_flexure", "phi_shear", "phi_punching",
+    "gamma_load", "load_model", "mode",
+)
+
+# Sweep length from which the prange variants pay for their thread start-up
+PARALLEL_MIN_POINTS = 1000
+
+
+@njit(cache=True)
+def _sweep_point(
+    s: float,
+    a_bond: float, tau_b_kNpm2: float, gamma_rock: float, tan_theta: float, h_block: float,
+    t_eff: float, c: float, f_r_kNpm2: float, v_rd_kNpm2: float, tau_v_kNpm2: float,
+    phi_flex: float, phi_shear: float, phi_punch: float, gamma_load: float,
+    load_model: float, mode: float,
+) -> Tuple[float, float, float, float, float, float, int]:
+    """
+    One spacing of the sweep: (W_total, v_adh, v_flex, v_punch, v_shear,
+    governing, governing_idx), where v_* are the per-mode FoS/utilisation.
+    """
+    # Panel load (no surcharge or shotcrete self-weight, as in check_design)
+    if load_model == LOAD_FLAT:
+        W, w = block_weight_flat_kernel(s, gamma_rock, h_block, 0.0, False, 0.0, 24.0)
+    else:
+        W, w = block_weight_pyramid_kernel(s, gamma_rock, tan_theta, 0.0, False, 0.0, 24.0)
+
+    C_adh, M_dem, M_cap, V_dem, V_cap, V_shear = _check_all_modes(
+        s, a_bond, tau_b_kNpm2, max(w, 0.0), t_eff, f_r_kNpm2, c, v_rd_kNpm2, tau_v_kNpm2
+    )
+
+    if mode == MODE_FOS:
+        v0 = evaluate_fos(C_adh, W)[0]
+        v1 = evaluate_fos(M_cap, M_dem)[0]
+        v2 = evaluate_fos(V_cap, V_dem)[0]
+        v3 = evaluate_fos(V_shear, W)[0]
+        # Governing: first minimum FoS
+        gov, k = v0, 0
+        if v1 < gov:
+            gov, k = v1, 1
+        if v2 < gov:
+            gov, k = v2, 2
+        if v3 < gov:
+            gov, k = v3, 3
+    else:
+        v0 = evaluate_lrfd(C_adh, W, phi_shear, gamma_load)[0]
+        v1 = evaluate_lrfd(M_cap, M_dem, phi_flex, gamma_load)[0]
+        v2 = evaluate_lrfd(V_cap, V_dem, phi_punch, gamma_load)[0]
+        v3 = evaluate_lrfd(V_shear, W, phi_shear, gamma_load)[0]
+        # Governing: first maximum utilisation
+        gov, k = v0, 0
+        if v1 > gov:
+            gov, k = v1, 1
+        if v2 > gov:
+            gov, k = v2, 2
+        if v3 > gov:
+            gov, k = v3, 3
+    return W, v0, v1, v2, v3, gov, k
+
+
+@njit(cache=True)
+def sweep_fos(
+    s_arr: np.ndarray, params: Tuple[float, ...]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Governing and per-mode FoS (or utilisation) for every spacing in 's_arr'.
+
+    Parameters
+    ----------
+    s_arr  : 1-D float64 array of spacings [m]; must all be > 0
+    params : flat tuple in SWEEP_PARAMS order. 'load_model' and 'mode' are the
+             LOAD_* / MODE_* codes above (as floats). Strength/geometry
+             entries must already be clamped (design._kernel_inputs).
+
+    Returns
+    -------
+    (governing[N], per_mode[4, N], governing_idx[N], W_total[N])
+      per_mode rows follow models.MODE_NAMES; governing is the min FoS (FOS)
+      or the max utilisation (LRFD) and governing_idx its row in per_mode.
+      W_total is the panel load [kN] (w_uniform = W_total / s^2), so callers
+      need no separate load pass.
+    """
+    (a_bond, tau_b_kNpm2, gamma_rock, tan_theta, h_block, t_eff, c,
+     f_r_kNpm2, v_rd_kNpm2, tau_v_kNpm2, phi_flex, phi_shear, phi_punch,
+     gamma_load, load_model, mode) = params
+
+    n = s_arr.shape[0]
+    governing = np.empty(n)
+    per_mode = np.empty((4, n))
+    governing_idx = np.empty(n, dtype=np.int64)
+    W_total = np.empty(n)
+
+    for i in range(n):
+        W_total[i], per_mode[0, i], per_mode[1, i], per_mode[2, i], per_mode[3, i], governing[i], governing_idx[i] = (
+            _sweep_point(
+                s_arr[i], a_bond, tau_b_kNpm2, gamma_rock, tan_theta, h_block, t_eff, c,
+                f_r_kNpm2, v_rd_kNpm2, tau_v_kNpm2, phi_flex, phi_shear, phi_punch,
+                gamma_load, load_model, mode,
+            )
+        )
+
+    return governing, per_mode, governing_idx, W_total
+
+
+@njit(cache=True, parallel=True)
+def sweep_fos_parallel(
+    s_arr: np.ndarray, params: Tuple[float, ...]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """sweep_fos() with the loop split over threads (prange); for N >= PARALLEL_MIN_POINTS."""
+    (a_bond, tau_b_kNpm2, gamma_rock, tan_theta, h_block, t_eff, c,
+     f_r_kNpm2, v_rd_kNpm2, tau_v_kNpm2, phi_flex, phi_shear, phi_punch,
+     gamma_load, load_model, mode) = params
+
+    n = s_arr.shape[0]
+    governing = np.empty(n)
+    per_mode = np.empty((4, n))
+    governing_idx = np.empty(n, dtype=np.int64)
+    W_total = np.empty(n)
+
+    for i in prange(n):
+        W_total[i], per_mode[0, i], per_mode[1, i], per_mode[2, i], per_mode[3, i], governing[i], governing_idx[i] = (
+            _sweep_point(
+                s_arr[i], a_bond, tau_b_kNpm2, gamma_rock, tan_theta, h_block, t_eff, c,
+                f_r_kNpm2, v_rd_kNpm2, tau_v_kNpm2, phi_flex, phi_shear, phi_punch,
+                gamma_load, load_model, mode,
+            )
+        )
+
+    return governing, per_mode, governing_idx, W_total
+
+
+def make_sweep_kernel(params: Tuple[float, ...], parallel: bool = False):
+    """
+    Compile a sweep kernel specialised to one set of inputs.
+
+    The SWEEP_PARAMS values are captured by a closure, which Numba freezes as
+    compile-time constants: the load-model/mode branches are folded away and
+    the constant products (e.g. 4*a_bond*tau_b) are computed once at compile
+    time. Returns kernel(s_arr) -> (governing[N], per_mode[4, N],
+    governing_idx[N], W_total[N]).
+
+    Each call compiles a new function (closures cannot use cache=True), so
+    callers should memoise the result per params tuple (design.build_sweep).
+    'parallel' compiles the loop with prange; only worth it for sweeps of
+    PARALLEL_MIN_POINTS spacings or more (see the module header).
+    """
+    (a_bond, tau_b_kNpm2, gamma_rock, tan_theta, h_block, t_eff, c,
+     f_r_kNpm2, v_rd_kNpm2, tau_v_kNpm2, phi_flex, phi_shear, phi_punch,
+     gamma_load, load_model, mode) = (float(p) for p in params)
+
+    @njit(parallel=parallel)
+    def kernel(s_arr):
+        n = s_arr.shape[0]
+        governing = np.empty(n)
+        per_mode = np.empty((4, n))
+        governing_idx = np.empty(n, dtype=np.int64)
+        W_total = np.empty(n)
+        for i in prange(n):
+            W_total[i], per_mode[0, i], per_mode[1, i], per_mode[2, i], per_mode[3, i], governing[i], governing_idx[i] = (
+                _sweep_point(
+                    s_arr[i], a_bond, tau_b_kNpm2, gamma_rock, tan_theta, h_block, t_eff, c,
+                    f_r_kNpm2, v_rd_kNpm2, tau_v_kNpm2, phi_flex, phi_shear, phi_punch,
+                    gamma_load, load_model, mode,
+                )
+            )
+        return governing, per_mode, governing_idx, W_total
+
+    return kernel
+
+
+__all__ = [
+    "sweep_fos",
+    "sweep_fos_parallel",
+    "make_sweep_kernel",
+    "PARALLEL_MIN_POINTS",
+    "SWEEP_PARAMS",
+    "LOAD_PYRAMID",
+    "LOAD_FLAT",
+    "MODE_FOS",
+    "MODE_LRFD",
+]
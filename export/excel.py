@@ -4,6 +4,9 @@
 #
 # What this file provides
 # -----------------------
+# - input_rows(inp) / results_rows(result, mode) / derived_rows(result)
+#       → (headers, rows) as plain tuples (the fixed table schemas)
+# - mode_rows(result) → the single per-mode pass shared by Results and Summary
 # - build_input_table(inp)           → pandas.DataFrame of inputs
 # - build_results_table(result)      → pandas.DataFrame of per-mode checks
 # - build_derived_table(result)      → pandas.DataFrame of derived values
@@ -13,123 +16,192 @@
 #       * "Results" sheet (per-mode)
 #       * "Derived" sheet (t_eff, W_total, w)
 #   Optional: include an extra sheet with a spacing sweep if you pass it in.
+# - export_to_excel_file(path, inp, res) → same workbook streamed to disk in
+#   constant-memory mode (for long sweeps)
+# - export_many_to_excel_bytes(scenarios) → one workbook holding the Summary/
+#   Inputs/Results/Derived sheets of several (inp, res) scenarios, prefixed
+#   "1_", "2_", ... (one workbook and one set of cell formats for the batch)
 #
-# Dependencies: pandas, numpy, xlsxwriter (pandas uses it as engine)
+# The workbook is written with xlsxwriter directly (write_row per table row);
+# pandas is only imported by the build_*_table helpers, for callers that want
+# DataFrames. Both are imported lazily (see _deps), not at module import.
+#
+# Dependencies: xlsxwriter; pandas (optional, build_*_table only)
 #
 from __future__ import annotations
 
+import math
+from functools import lru_cache
 from io import BytesIO
-from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
-
-import pandas as pd
-import numpy as np
+from operator import attrgetter
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 # Import dataclasses for typing & dict access (no heavy logic here)
-from core.models import DesignInput, DesignResult, ModeResult, DesignMode
+from core.models import DesignInput, DesignResult, ModeResult, DesignMode, MODE_NAMES
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+    from xlsxwriter import Workbook
+    from xlsxwriter.worksheet import Worksheet
+
+
+@lru_cache(maxsize=None)
+def _deps() -> SimpleNamespace:
+    """
+    Third-party writer imports, done on the first export instead of at module
+    import (importing export.excel stays cheap for code that never exports).
+    """
+    import xlsxwriter
+
+    return SimpleNamespace(Workbook=xlsxwriter.Workbook)
+
+
+_NAN = float("nan")  # placeholder for missing values (blank cell in Excel)
+
+# Enum-valued cells use the member's _value_ (a plain str attribute) rather than
+# the .value property; the strings are the same.
+
+# Summary sheet: (label, getter) for the short "Key inputs" list
+_KEY_INPUT_LABELS = (
+    ("Bolt spacing s (m)", attrgetter("s")),
+    ("Thickness t (m)", attrgetter("t")),
+    ("Effective plate width c (m)", attrgetter("c")),
+    ("Rock unit weight γ (kN/m³)", attrgetter("gamma_rock")),
+    ("Load model", attrgetter("load_model._value_")),
+    ("Geology preset", attrgetter("geology_preset._value_")),
+    ("θ (deg)", attrgetter("theta_deg")),
+    ("h_block (m)", attrgetter("h_block")),
+    ("Adhesive length a_bond (m)", attrgetter("a_bond")),
+    ("Durability deduction (m)", attrgetter("factors.t_dur_deduction")),
+)
+_SUMMARY_MODE_HEADERS = ("Mode", "Demand", "Capacity", "FoS", "Utilisation", "Pass", "Detail")
+
+Row = Tuple[object, ...]
+Table = Tuple[Tuple[str, ...], List[Row]]
+
+# Header cell format pandas' to_excel uses, so sheets look as they did before
+_HEADER_FORMAT = {"bold": True, "border": 1, "align": "center", "valign": "top"}
+
+# Every cell format the sheets use; added once per workbook (see _add_formats)
+_FORMATS = {
+    "header": _HEADER_FORMAT,
+    "h1": {"bold": True, "font_size": 14},
+    "h2": {"bold": True, "font_size": 12},
+    "lab": {"bold": True},
+    "okf": {"bold": True, "font_color": "#007700"},
+    "nof": {"bold": True, "font_color": "#AA0000"},
+}
 
 
 # -----------------------------
-# Table builders (pandas)
+# Table rows (fixed schemas)
 # -----------------------------
-def build_input_table(inp: DesignInput) -> pd.DataFrame:
+def input_rows(inp: DesignInput) -> Table:
     """
-    Flatten DesignInput into a tidy one-column table for Excel.
+    Flatten DesignInput into a tidy (Parameter, Value) table for Excel.
     """
-    data = {
-        "Parameter": [
-            "Design mode",
-            "Bolt spacing s (m)",
-            "Thickness t (m)",
-            "Effective plate width c (m)",
-            "Rock unit weight γ (kN/m³)",
-            "Load model",
-            "Geology preset",
-            "θ (deg) (pyramid/shale)",
-            "h_block (m) (flat)",
-            "Adhesive length a_bond (m)",
-            "f_c (MPa)",
-            "τ_b (MPa)",
-            "f_r (MPa)",
-            "τ_v (MPa)",
-            "v_rd (MPa)",
-            "φ_flexure",
-            "φ_shear",
-            "φ_punching",
-            "γ_load",
-            "Durability deduction (m)",
-            "Age label",
-            "Notes",
-        ],
-        "Value": [
-            inp.factors.mode.value,
-            inp.s,
-            inp.t,
-            inp.c,
-            inp.gamma_rock,
-            inp.load_model.value,
-            inp.geology_preset.value,
-            inp.theta_deg,
-            inp.h_block,
-            inp.a_bond,
-            inp.materials.f_c,
-            inp.materials.tau_b,
-            inp.materials.f_r,
-            inp.materials.tau_v,
-            inp.materials.v_rd,
-            inp.factors.phi_flexure,
-            inp.factors.phi_shear,
-            inp.factors.phi_punching,
-            inp.factors.gamma_load,
-            inp.factors.t_dur_deduction,
-            inp.age_label,
-            inp.notes,
-        ],
-    }
-    return pd.DataFrame(data)
+    rows = [
+        ("Design mode", inp.factors.mode._value_),
+        ("Bolt spacing s (m)", inp.s),
+        ("Thickness t (m)", inp.t),
+        ("Effective plate width c (m)", inp.c),
+        ("Rock unit weight γ (kN/m³)", inp.gamma_rock),
+        ("Load model", inp.load_model._value_),
+        ("Geology preset", inp.geology_preset._value_),
+        ("θ (deg) (pyramid/shale)", inp.theta_deg),
+        ("h_block (m) (flat)", inp.h_block),
+        ("Adhesive length a_bond (m)", inp.a_bond),
+        ("f_c (MPa)", inp.materials.f_c),
+        ("τ_b (MPa)", inp.materials.tau_b),
+        ("f_r (MPa)", inp.materials.f_r),
+        ("τ_v (MPa)", inp.materials.tau_v),
+        ("v_rd (MPa)", inp.materials.v_rd),
+        ("φ_flexure", inp.factors.phi_flexure),
+        ("φ_shear", inp.factors.phi_shear),
+        ("φ_punching", inp.factors.phi_punching),
+        ("γ_load", inp.factors.gamma_load),
+        ("Durability deduction (m)", inp.factors.t_dur_deduction),
+        ("Age label", inp.age_label),
+        ("Notes", inp.notes),
+    ]
+    return ("Parameter", "Value"), rows
 
 
-def build_results_table(result: DesignResult, mode: DesignMode) -> pd.DataFrame:
+def mode_rows(result: DesignResult) -> List[Row]:
+    """
+    One (name, demand, capacity, fos, utilization, passes, detail) tuple per
+    mode, in result order. fos/utilization/passes may be None. Built once per
+    export and shared by the Results and Summary sheets.
+    """
+    return [
+        (name, mr.demand, mr.capacity, mr.fos, mr.utilization, mr.passes, mr.detail)
+        for name, mr in zip(MODE_NAMES, result.modes)
+    ]
+
+
+def results_rows(result: DesignResult, mode: DesignMode, rows: Optional[List[Row]] = None) -> Table:
     """
-    Build a per-mode results table suitable for Excel.
+    Per-mode results table; the value column is FoS or Utilisation per 'mode'.
+    'rows' are mode_rows(result), if already computed.
     """
-    rows = []
-    for name, mr in result.modes.items():
-        rows.append({
-            "Mode": name,
-            "Demand": mr.demand,
-            "Capacity": mr.capacity,
-            "FoS": (mr.fos if mr.fos is not None else np.nan),
-            "Utilisation": (mr.utilization if mr.utilization is not None else np.nan),
-            "Pass": mr.passes,
-            "Detail": mr.detail,
-        })
-    df = pd.DataFrame(rows)
-    # Order columns for clarity
+    if rows is None:
+        rows = mode_rows(result)
     if mode == DesignMode.FOS:
-        df = df[["Mode", "Demand", "Capacity", "FoS", "Pass", "Detail"]]
+        headers, j = ("Mode", "Demand", "Capacity", "FoS", "Pass", "Detail"), 3
     else:
-        df = df[["Mode", "Demand", "Capacity", "Utilisation", "Pass", "Detail"]]
-    return df
+        headers, j = ("Mode", "Demand", "Capacity", "Utilisation", "Pass", "Detail"), 4
+    table = [
+        (r[0], r[1], r[2], (r[j] if r[j] is not None else _NAN), r[5], r[6])
+        for r in rows
+    ]
+    return headers, table
 
 
-def build_derived_table(result: DesignResult) -> pd.DataFrame:
+def derived_rows(result: DesignResult) -> Table:
+    """
+    Derived scalars (effective thickness, loads, etc.) as (Quantity, Value, Unit).
+    """
+    teff = result.derived.get("t_eff", _NAN)
+    Wtot = result.derived.get("W_total_kN", _NAN)
+    wuni = result.derived.get("w_kNpm2", _NAN)
+    rows = [
+        ("Effective thickness t_eff", teff, "m"),
+        ("Total panel load W_total", Wtot, "kN"),
+        ("Uniform load w", wuni, "kN/m²"),
+    ]
+    return ("Quantity", "Value", "Unit"), rows
+
+
+# -----------------------------
+# Table builders (pandas, optional)
+# -----------------------------
+def _to_dataframe(table: Table) -> pd.DataFrame:
+    import pandas as pd  # lazy: only callers that ask for DataFrames need pandas
+
+    headers, rows = table
+    return pd.DataFrame(rows, columns=list(headers))
+
+
+def build_input_table(inp: DesignInput) -> pd.DataFrame:
     """
-    Collect derived scalars (effective thickness, loads, etc.).
+    Flatten DesignInput into a tidy one-column table (pandas DataFrame).
     """
-    d = {
-        "Quantity": [],
-        "Value": [],
-        "Unit": [],
-    }
-    teff = result.derived.get("t_eff", np.nan)
-    Wtot = result.derived.get("W_total_kN", np.nan)
-    wuni = result.derived.get("w_kNpm2", np.nan)
+    return _to_dataframe(input_rows(inp))
 
-    d["Quantity"] += ["Effective thickness t_eff", "Total panel load W_total", "Uniform load w"]
-    d["Value"] += [teff, Wtot, wuni]
-    d["Unit"] += ["m", "kN", "kN/m²"]
 
-    return pd.DataFrame(d)
+def build_results_table(result: DesignResult, mode: DesignMode) -> pd.DataFrame:
+    """
+    Build a per-mode results table (pandas DataFrame).
+    """
+    return _to_dataframe(results_rows(result, mode))
+
+
+def build_derived_table(result: DesignResult) -> pd.DataFrame:
+    """
+    Collect derived scalars (effective thickness, loads, etc.) as a DataFrame.
+    """
+    return _to_dataframe(derived_rows(result))
 
 
 # -----------------------------
@@ -160,58 +232,166 @@ def export_to_excel_bytes(
         The content of the .xlsx file, ready for download or saving.
     """
     bio = BytesIO()
-    with pd.ExcelWriter(bio, engine="xlsxwriter") as writer:
-        # Sheets
-        # 1) Summary
-        _write_summary_sheet(writer, inp, result, design_mode)
+    _write_workbook(
+        _deps().Workbook(bio, {"in_memory": True}),
+        inp, result, spacing_sweep, design_mode,
+    )
+    return bio.getvalue()
 
-        # 2) Inputs
-        build_input_table(inp).to_excel(writer, sheet_name="Inputs", index=False)
 
-        # 3) Results
-        build_results_table(result, mode=inp.factors.mode).to_excel(writer, sheet_name="Results", index=False)
+def export_to_excel_file(
+    path: str,
+    inp: DesignInput,
+    result: DesignResult,
+    *,
+    spacing_sweep: Optional[Tuple[Iterable[float], Iterable[float]]] = None,
+    design_mode: Optional[DesignMode] = None,
+    tmpdir: Optional[str] = None,
+) -> None:
+    """
+    Same workbook as export_to_excel_bytes(), streamed straight to 'path'.
 
-        # 4) Derived
-        build_derived_table(result).to_excel(writer, sheet_name="Derived", index=False)
+    Uses xlsxwriter's constant_memory mode: each row is flushed to a temporary
+    file (in 'tmpdir', default: the system temp dir) as soon as the next row
+    starts, so memory stays flat however long the spacing sweep is, and no
+    in-memory copy of the finished file is made. 's_vals'/'y_vals' may be any
+    iterables (arrays, generators); they are consumed once.
+    """
+    options = {"constant_memory": True}
+    if tmpdir is not None:
+        options["tmpdir"] = tmpdir
+    _write_workbook(_deps().Workbook(path, options), inp, result, spacing_sweep, design_mode)
 
-        # 5) Optional spacing sweep
-        if spacing_sweep is not None:
-            s_vals, y_vals = spacing_sweep
-            _write_spacing_sweep_sheet(writer, s_vals, y_vals, design_mode or inp.factors.mode)
 
-        # Post-format tweaks (set column widths for first few sheets)
-        _autofit_columns(writer, "Inputs")
-        _autofit_columns(writer, "Results")
-        _autofit_columns(writer, "Derived")
+def export_many_to_excel_bytes(
+    scenarios: Sequence[Tuple[DesignInput, DesignResult]],
+    *,
+    design_mode: Optional[DesignMode] = None,
+) -> bytes:
+    """
+    One in-memory .xlsx workbook for several design scenarios.
 
+    Scenario i (1-based) gets the usual Summary/Inputs/Results/Derived sheets
+    named "i_Summary", "i_Inputs", ... in scenario order. The workbook and
+    its cell formats are set up once for the whole batch, which is cheaper
+    than one export_to_excel_bytes() call per scenario.
+
+    Parameters
+    ----------
+    scenarios   : sequence of (DesignInput, DesignResult) pairs
+    design_mode : override the mode label on every Summary sheet, if provided.
+    """
+    bio = BytesIO()
+    wb = _deps().Workbook(bio, {"in_memory": True})
+    fmts = _add_formats(wb)
+    for i, (inp, result) in enumerate(scenarios, start=1):
+        _write_scenario_sheets(wb, fmts, inp, result, design_mode, prefix=f"{i}_")
+    wb.close()
     return bio.getvalue()
 
 
+def _write_workbook(
+    wb: Workbook,
+    inp: DesignInput,
+    result: DesignResult,
+    spacing_sweep: Optional[Tuple[Iterable[float], Iterable[float]]],
+    design_mode: Optional[DesignMode],
+) -> None:
+    """
+    Write all sheets to 'wb' and close it. Every sheet is written strictly
+    row by row, as constant_memory mode requires.
+    """
+    fmts = _add_formats(wb)
+
+    # 1)-4) Summary, Inputs, Results, Derived
+    _write_scenario_sheets(wb, fmts, inp, result, design_mode)
+
+    # 5) Optional spacing sweep
+    if spacing_sweep is not None:
+        s_vals, y_vals = spacing_sweep
+        _write_spacing_sweep_sheet(wb, s_vals, y_vals, design_mode or inp.factors.mode, fmts.header)
+
+    wb.close()
+
+
+def _write_scenario_sheets(
+    wb: Workbook,
+    fmts: SimpleNamespace,
+    inp: DesignInput,
+    result: DesignResult,
+    design_mode: Optional[DesignMode],
+    prefix: str = "",
+) -> None:
+    """The Summary, Inputs, Results and Derived sheets of one scenario."""
+    # 1) Summary
+    # Per-mode rows, shared by the Summary and Results sheets
+    rows = mode_rows(result)
+    _write_summary_sheet(wb, inp, result, design_mode, rows, fmts=fmts, name=prefix + "Summary")
+
+    # 2) Inputs
+    ws = _write_table_sheet(wb, prefix + "Inputs", input_rows(inp), fmts.header)
+    _autofit_columns(ws, "Inputs")
+
+    # 3) Results
+    ws = _write_table_sheet(wb, prefix + "Results", results_rows(result, inp.factors.mode, rows), fmts.header)
+    _autofit_columns(ws, "Results")
+
+    # 4) Derived
+    ws = _write_table_sheet(wb, prefix + "Derived", derived_rows(result), fmts.header)
+    _autofit_columns(ws, "Derived")
+
+
 # -----------------------------
 # Helpers (xlsxwriter formatting)
 # -----------------------------
+def _add_formats(wb: Workbook) -> SimpleNamespace:
+    """Add every _FORMATS entry to 'wb' once; attributes are the keys."""
+    return SimpleNamespace(**{key: wb.add_format(props) for key, props in _FORMATS.items()})
+
+
+def _cell(value: object) -> object:
+    """
+    Excel-safe cell value, matching pandas' to_excel defaults: NaN/None become
+    blank cells and ±inf the strings "inf"/"-inf" (xlsxwriter rejects both).
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        return "" if math.isnan(value) else ("inf" if value > 0 else "-inf")
+    return "" if value is None else value
+
+
+def _write_table_sheet(wb: Workbook, name: str, table: Table, header_fmt) -> Worksheet:
+    """Write a (headers, rows) table to a new sheet, one write_row per row."""
+    headers, rows = table
+    ws = wb.add_worksheet(name)
+    ws.write_row(0, 0, headers, header_fmt)
+    for i, row in enumerate(rows, start=1):
+        ws.write_row(i, 0, [_cell(v) for v in row])
+    return ws
+
+
 def _write_summary_sheet(
-    writer: pd.ExcelWriter,
+    wb: Workbook,
     inp: DesignInput,
     result: DesignResult,
     design_mode: Optional[DesignMode] = None,
+    rows: Optional[List[Row]] = None,
+    *,
+    fmts: Optional[SimpleNamespace] = None,
+    name: str = "Summary",
 ) -> None:
-    ws = writer.book.add_worksheet("Summary")
-    writer.sheets["Summary"] = ws
+    ws = wb.add_worksheet(name)
 
-    # Formats
-    h1 = writer.book.add_format({"bold": True, "font_size": 14})
-    h2 = writer.book.add_format({"bold": True, "font_size": 12})
-    lab = writer.book.add_format({"bold": True})
-    okf = writer.book.add_format({"bold": True, "font_color": "#007700"})
-    nof = writer.book.add_format({"bold": True, "font_color": "#AA0000"})
+    # Formats (shared across the workbook when passed in)
+    if fmts is None:
+        fmts = _add_formats(wb)
+    h1, h2, lab, okf, nof = fmts.h1, fmts.h2, fmts.lab, fmts.okf, fmts.nof
 
     # Title
     ws.write(0, 0, "Shotcrete Support Design — Summary", h1)
 
     # Governing
     ws.write(2, 0, "Design mode:", lab)
-    ws.write(2, 1, (design_mode or inp.factors.mode).value)
+    ws.write(2, 1, design_mode or inp.factors.mode)  # str-valued enum: written as its value
 
     ws.write(3, 0, "Governing mode:", lab)
     ws.write(3, 1, result.governing_mode)
@@ -224,42 +404,27 @@ def _write_summary_sheet(
 
     # Key inputs (short list)
     ws.write(7, 0, "Key inputs", h2)
-    key_inputs = [
-        ("Bolt spacing s (m)", inp.s),
-        ("Thickness t (m)", inp.t),
-        ("Effective plate width c (m)", inp.c),
-        ("Rock unit weight γ (kN/m³)", inp.gamma_rock),
-        ("Load model", inp.load_model.value),
-        ("Geology preset", inp.geology_preset.value),
-        ("θ (deg)", inp.theta_deg),
-        ("h_block (m)", inp.h_block),
-        ("Adhesive length a_bond (m)", inp.a_bond),
-        ("Durability deduction (m)", inp.factors.t_dur_deduction),
-    ]
     row = 8
-    for label, val in key_inputs:
-        ws.write(row, 0, label)
-        if isinstance(val, (int, float)):
-            ws.write_number(row, 1, float(val))
-        else:
-            ws.write(row, 1, str(val))
+    for label, get in _KEY_INPUT_LABELS:
+        val = get(inp)
+        ws.write_row(row, 0, (label, float(val) if isinstance(val, (int, float)) else str(val)))
         row += 1
 
     # Per-mode compact view
     ws.write(row + 1, 0, "Per-mode checks", h2)
     row += 2
-    headers = ["Mode", "Demand", "Capacity", "FoS", "Utilisation", "Pass", "Detail"]
-    for j, h in enumerate(headers):
-        ws.write(row, j, h, lab)
+    ws.write_row(row, 0, _SUMMARY_MODE_HEADERS, lab)
     row += 1
-    for name, mr in result.modes.items():
-        ws.write(row, 0, name)
-        ws.write_number(row, 1, float(mr.demand))
-        ws.write_number(row, 2, float(mr.capacity))
-        ws.write(row, 3, "" if mr.fos is None else float(mr.fos))
-        ws.write(row, 4, "" if mr.utilization is None else float(mr.utilization))
-        ws.write(row, 5, "Yes" if (mr.passes is True) else ("No" if (mr.passes is False) else ""))
-        ws.write(row, 6, mr.detail or "")
+    for name, demand, capacity, fos, util, passes, detail in (mode_rows(result) if rows is None else rows):
+        ws.write_row(row, 0, (
+            name,
+            float(demand),
+            float(capacity),
+            "" if fos is None else _cell(float(fos)),
+            "" if util is None else _cell(float(util)),
+            "Yes" if (passes is True) else ("No" if (passes is False) else ""),
+            detail or "",
+        ))
         row += 1
 
     # Column widths
@@ -270,22 +435,36 @@ def _write_summary_sheet(
 
 
 def _write_spacing_sweep_sheet(
-    writer: pd.ExcelWriter,
-    s_vals: Sequence[float],
-    y_vals: Sequence[float],
+    wb: Workbook,
+    s_vals: Iterable[float],
+    y_vals: Iterable[float],
     design_mode: DesignMode,
+    header_fmt=None,
 ) -> None:
     """
     Writes a sheet "SpacingSweep" with two columns (s, y) and a simple line chart.
+
+    Normally each column is written with one write_column call on the values
+    as given (arrays/lists are not copied). In constant_memory mode rows must
+    be written in order, so the values are streamed row by row instead.
     """
-    df = pd.DataFrame({"s (m)": list(s_vals), ("FoS" if design_mode == DesignMode.FOS else "Utilisation"): list(y_vals)})
-    df.to_excel(writer, sheet_name="SpacingSweep", index=False)
-    ws = writer.sheets["SpacingSweep"]
+    y_label = "FoS" if design_mode == DesignMode.FOS else "Utilisation"
+    ws = wb.add_worksheet("SpacingSweep")
+    ws.write_row(0, 0, ("s (m)", y_label), header_fmt)
+    if ws.constant_memory:
+        n = 0
+        for n, (s, y) in enumerate(zip(s_vals, y_vals), start=1):
+            ws.write_row(n, 0, (_cell(s), _cell(y)))
+    else:
+        if not hasattr(s_vals, "__len__"):
+            s_vals = list(s_vals)  # need the length for the chart range
+        n = len(s_vals)
+        ws.write_column(1, 0, map(_cell, s_vals))
+        ws.write_column(1, 1, map(_cell, y_vals))
 
     # Add a chart
-    chart = writer.book.add_chart({"type": "line"})
+    chart = wb.add_chart({"type": "line"})
     # Data range (xlsxwriter is 0-indexed rows, but Excel A1 ranges below use 1-based headers)
-    n = len(df)
     chart.add_series({
         "name":       [ "SpacingSweep", 0, 1 ],
         "categories": [ "SpacingSweep", 1, 0, n, 0 ],
@@ -299,15 +478,11 @@ def _write_spacing_sweep_sheet(
     ws.insert_chart("D2", chart, {"x_scale": 1.3, "y_scale": 1.2})
 
 
-def _autofit_columns(writer: pd.ExcelWriter, sheet_name: str) -> None:
+def _autofit_columns(ws: Worksheet, sheet_name: str) -> None:
     """
-    Best-effort column auto-fit for a given sheet (works on already-written DataFrame).
+    Best-effort column widths for the fixed-schema sheets.
     """
-    ws = writer.sheets.get(sheet_name)
-    if ws is None:
-        return
-    # We don't have direct text measurement; use simple heuristics
-    # Find the DataFrame back via the workbook? Not available; so set some defaults
+    # We don't have direct text measurement; use simple per-sheet defaults
     if sheet_name == "Inputs":
         ws.set_column(0, 0, 34)  # Parameter
         ws.set_column(1, 1, 40)  # Value
@@ -2,7 +2,7 @@
 # ------------------------------------------------------------
 # Minimal Streamlit UI for the shotcrete design tool (MVP).
 # - Collects inputs
-# - Calls core.design.check_design()
+# - Calls core.design.check_design() (memoised per input set, see _cached_check)
 # - Shows per-mode results + governing mode
 # - Optional: spacing sweep plot (stability-style chart)
 #
@@ -11,95 +11,229 @@
 #
 from __future__ import annotations
 
-import math
-from dataclasses import asdict
+import io
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
+import numpy as np  # already loaded by core.design
 
 # Local imports (no circular refs; core/* never imports streamlit_app)
 from core.models import (
     DesignInput, MaterialProps, CodeFactors,
-    DesignMode, LoadModel, GeologyPreset
+    DesignMode, LoadModel, GeologyPreset, MODE_NAMES
 )
-from core.design import check_design
+from core.design import check_design, check_design_sweep
+# pandas and charts.plots (matplotlib) are imported where first needed, so the
+# first run of a session does not pay for them until Calculate / a sweep
 
 
 # -----------------------------
 # UI Helpers
 # -----------------------------
+# Widget label -> enum member, in display order (the first entry is the default)
+_DESIGN_MODE_BY_LABEL = {"FoS": DesignMode.FOS, "LRFD": DesignMode.LRFD}
+_LOAD_MODEL_BY_LABEL = {
+    "Pyramid60 (1995)": LoadModel.PYRAMID_60,
+    "FlatBlock (2017)": LoadModel.FLAT_BLOCK,
+    "ShaleWedge (2017)": LoadModel.SHALE_WEDGE,
+}
+_GEOLOGY_BY_LABEL = {
+    "Generic": GeologyPreset.GENERIC,
+    "HawkesburySandstone": GeologyPreset.HAWKESBURY,
+    "AshfieldShale": GeologyPreset.ASHFIELD,
+}
+
+
 def _design_mode_radio() -> DesignMode:
-    pick = st.radio("Design mode", ["FoS", "LRFD"], horizontal=True, index=0)
-    return DesignMode.FOS if pick == "FoS" else DesignMode.LRFD
+    pick = st.radio("Design mode", list(_DESIGN_MODE_BY_LABEL), horizontal=True, index=0)
+    return _DESIGN_MODE_BY_LABEL[pick]
 
 
 def _load_model_select() -> LoadModel:
-    label = st.selectbox(
-        "Load model (block/wedge)",
-        ["Pyramid60 (1995)", "FlatBlock (2017)", "ShaleWedge (2017)"],
-        index=0,
-    )
-    if "Pyramid" in label:
-        return LoadModel.PYRAMID_60
-    if "FlatBlock" in label:
-        return LoadModel.FLAT_BLOCK
-    return LoadModel.SHALE_WEDGE
+    label = st.selectbox("Load model (block/wedge)", list(_LOAD_MODEL_BY_LABEL), index=0)
+    return _LOAD_MODEL_BY_LABEL[label]
 
 
 def _geology_select() -> GeologyPreset:
     label = st.selectbox(
         "Geology preset (affects only your interpretation; loads set below)",
-        ["Generic", "HawkesburySandstone", "AshfieldShale"],
+        list(_GEOLOGY_BY_LABEL),
         index=0,
     )
-    if "Hawkesbury" in label:
-        return GeologyPreset.HAWKESBURY
-    if "Ashfield" in label:
-        return GeologyPreset.ASHFIELD
-    return GeologyPreset.GENERIC
+    return _GEOLOGY_BY_LABEL[label]
+
+
+# Default materials/factors (frozen dataclasses, so shared singletons are safe)
+# Conservative starting points; tune per project/testing
+_DEFAULT_MATERIALS = MaterialProps(
+    f_c=30.0,     # MPa
+    tau_b=1.0,   # MPa (adhesion)
+    f_r=1.2,     # MPa (residual flexural strength for SFRS)
+    tau_v=1.5,   # MPa (in-plane shear)
+    v_rd=1.2,    # MPa (punching/diagonal tension)
+)
+_DEFAULT_FACTORS = {
+    DesignMode.LRFD: CodeFactors(
+        mode=DesignMode.LRFD,
+        phi_flexure=0.6,
+        phi_shear=0.6,
+        phi_punching=0.6,
+        gamma_load=1.5,
+        t_dur_deduction=0.0,
+    ),
+    DesignMode.FOS: CodeFactors(
+        mode=DesignMode.FOS,
+        phi_flexure=0.6,
+        phi_shear=0.6,
+        phi_punching=0.6,
+        gamma_load=1.0,  # ignored in FoS
+        t_dur_deduction=0.0,
+    ),
+}
 
 
 def _default_materials() -> MaterialProps:
-    # Conservative starting points; tune per project/testing
-    return MaterialProps(
-        f_c=30.0,     # MPa
-        tau_b=1.0,   # MPa (adhesion)
-        f_r=1.2,     # MPa (residual flexural strength for SFRS)
-        tau_v=1.5,   # MPa (in-plane shear)
-        v_rd=1.2,    # MPa (punching/diagonal tension)
-    )
+    return _DEFAULT_MATERIALS
 
 
 def _default_factors(mode: DesignMode) -> CodeFactors:
-    if mode == DesignMode.LRFD:
-        return CodeFactors(
-            mode=mode,
-            phi_flexure=0.6,
-            phi_shear=0.6,
-            phi_punching=0.6,
-            gamma_load=1.5,
-            t_dur_deduction=0.0,
-        )
-    else:
-        return CodeFactors(
-            mode=mode,
-            phi_flexure=0.6,
-            phi_shear=0.6,
-            phi_punching=0.6,
-            gamma_load=1.0,  # ignored in FoS
-            t_dur_deduction=0.0,
-        )
+    return _DEFAULT_FACTORS[mode]
+
+
+# -----------------------------
+# Cached design check
+# -----------------------------
+def _design_input(
+    s: float, t: float, c: float, gamma_rock: float,
+    load_model_name: str, geology_name: str, theta_deg: float, h_block: float,
+    tau_b: float, f_r: float, tau_v: float, v_rd: float,
+    mode_name: str, phi_flex: float, phi_shear: float, phi_punch: float,
+    gamma_load: float, t_dur: float, a_bond: float,
+) -> DesignInput:
+    """DesignInput from plain values; enums are passed by member name."""
+    return DesignInput(
+        s=s,
+        t=t,
+        c=c,
+        gamma_rock=gamma_rock,
+        load_model=LoadModel[load_model_name],
+        geology_preset=GeologyPreset[geology_name],
+        theta_deg=theta_deg,
+        h_block=h_block,
+        materials=MaterialProps(
+            f_c=30.0,  # not used directly in MVP; placeholder for future mappings
+            tau_b=tau_b,
+            f_r=f_r,
+            tau_v=tau_v,
+            v_rd=v_rd,
+        ),
+        factors=CodeFactors(
+            mode=DesignMode[mode_name],
+            phi_flexure=phi_flex,
+            phi_shear=phi_shear,
+            phi_punching=phi_punch,
+            gamma_load=gamma_load,
+            t_dur_deduction=t_dur,
+        ),
+        age_label="User-set",
+        notes="MVP run",
+        a_bond=a_bond,
+    )
+
+
+# Position of mode_name in the _design_input() arguments
+_MODE_ARG = 12
+
+
+@st.cache_data(show_spinner=False)
+def _cached_check(*inputs) -> dict:
+    """
+    check_design() for the _design_input() arguments, memoised by Streamlit.
+
+    Only hashable primitives go in (floats and enum names) and a plain dict
+    comes out, so reruns triggered by unrelated widgets hit the cache. The
+    per-mode table is stored column-wise ("modes": column -> list), ready for
+    one pd.DataFrame() call; missing FoS/Utilisation are NaN so those columns
+    stay float64.
+    """
+    result = check_design(_design_input(*inputs))
+    mrs = result.modes
+    nan = float("nan")
+    return {
+        "modes": {
+            "Mode": list(MODE_NAMES),
+            "Demand": [mr.demand for mr in mrs],
+            "Capacity": [mr.capacity for mr in mrs],
+            "FoS": [nan if mr.fos is None else mr.fos for mr in mrs],
+            "Utilisation": [nan if mr.utilization is None else mr.utilization for mr in mrs],
+            "Pass": ["Yes" if (mr.passes is True) else ("No" if (mr.passes is False) else "") for mr in mrs],
+            "Detail": [mr.detail for mr in mrs],
+        },
+        "governing_mode": result.governing_mode,
+        "governing_value": result.governing_value,
+        "ok": result.ok,
+        "derived": dict(result.derived),
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _cached_sweep(s_min: float, s_max: float, npts: int, *inputs) -> tuple:
+    """
+    (s_vals, governing) over np.linspace(s_min, s_max, npts), one
+    check_design_sweep() call for all spacings ('inputs' as in _cached_check;
+    their spacing is ignored).
+    """
+    s_vals = np.linspace(s_min, s_max, npts)
+    sweep = check_design_sweep(_design_input(*inputs), s_vals)
+    return s_vals, sweep["governing"]
+
+
+# Sweep chart: LRFD utilisations are clipped to this value for display
+_UTIL_DISPLAY_MAX = 3.0
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _sweep_png(s_min: float, s_max: float, npts: int, *inputs) -> bytes:
+    """
+    Governing-vs-spacing chart for _cached_sweep(s_min, s_max, npts, *inputs)
+    as PNG bytes. Each cache miss draws a fresh Figure (never the module-level
+    one of SHOTCRETE_REUSE_FIG), so no Figure is kept alive or shared between
+    sessions.
+    """
+    from charts.plots import plot_governing_vs_spacing
+
+    s_vals, y_vals = _cached_sweep(s_min, s_max, npts, *inputs)
+    mode_name = inputs[_MODE_ARG]
+    lrfd = mode_name == DesignMode.LRFD.name
+    if lrfd:
+        # Display-only: utilisations far above 1 would dominate the y-axis
+        y_vals = np.clip(y_vals, 0.0, _UTIL_DISPLAY_MAX)
+    fig = plot_governing_vs_spacing(s_vals, y_vals, design_mode=mode_name, reuse=False)
+    if lrfd:
+        # Fixed range, so the axis does not jump between sweeps
+        fig.axes[0].set_ylim(0.0, _UTIL_DISPLAY_MAX)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    return buf.getvalue()
+
+
+# Display formats for the per-mode table (see _cached_check for the columns)
+_RESULTS_COLUMN_CONFIG = {
+    "Demand": st.column_config.NumberColumn(format="%.3f"),
+    "Capacity": st.column_config.NumberColumn(format="%.3f"),
+    "FoS": st.column_config.NumberColumn(format="%.3f"),
+    "Utilisation": st.column_config.NumberColumn(format="%.3f"),
+}
 
 
 # -----------------------------
 # Sidebar inputs
 # -----------------------------
+# The inputs sit in a form: editing them does not rerun the script, only
+# "Calculate" does (and then with all edits at once).
 st.set_page_config(page_title="Shotcrete Support Designer (MVP)", layout="wide")
 st.title("Shotcrete Support Design in Blocky Ground — MVP")
 
-with st.sidebar:
+with st.sidebar.form("inputs"):
     st.header("Geometry & Materials")
 
     s = st.number_input("Bolt spacing s (m)", min_value=0.5, max_value=5.0, value=1.5, step=0.1)
@@ -127,125 +261,96 @@ with st.sidebar:
     st.divider()
     st.header("Factors & Durability")
     mode = _design_mode_radio()
-    phi_flex = st.number_input("φ_flexure (LRFD)", min_value=0.3, max_value=0.9, value=0.6, step=0.05, format="%.2f")
-    phi_shear = st.number_input("φ_shear (LRFD)", min_value=0.3, max_value=0.9, value=0.6, step=0.05, format="%.2f")
-    phi_punch = st.number_input("φ_punching (LRFD)", min_value=0.3, max_value=0.9, value=0.6, step=0.05, format="%.2f")
-    gamma_load = st.number_input("γ_load (LRFD)", min_value=1.0, max_value=2.0, value=1.5, step=0.1, format="%.2f")
-    t_dur = st.number_input("Durability deduction (m)", min_value=0.0, max_value=0.05, value=0.0, step=0.005, format="%.3f")
+    fac = _default_factors(DesignMode.LRFD)  # the φ/γ inputs are LRFD factors
+    phi_flex = st.number_input("φ_flexure (LRFD)", min_value=0.3, max_value=0.9, value=fac.phi_flexure, step=0.05, format="%.2f")
+    phi_shear = st.number_input("φ_shear (LRFD)", min_value=0.3, max_value=0.9, value=fac.phi_shear, step=0.05, format="%.2f")
+    phi_punch = st.number_input("φ_punching (LRFD)", min_value=0.3, max_value=0.9, value=fac.phi_punching, step=0.05, format="%.2f")
+    gamma_load = st.number_input("γ_load (LRFD)", min_value=1.0, max_value=2.0, value=fac.gamma_load, step=0.1, format="%.2f")
+    t_dur = st.number_input("Durability deduction (m)", min_value=0.0, max_value=0.05, value=fac.t_dur_deduction, step=0.005, format="%.3f")
 
     st.divider()
     st.header("Adhesion ring parameter")
     a_bond = st.number_input("Adhesive length a_bond (m)", min_value=0.00, max_value=0.10, value=0.05, step=0.005, format="%.3f")
 
     st.divider()
-    run_calc = st.button("Calculate", type="primary")
+    run_calc = st.form_submit_button("Calculate", type="primary")
 
 
 # -----------------------------
-# Build input object & run
+# Build inputs & run
 # -----------------------------
-materials = MaterialProps(
-    f_c=30.0,  # not used directly in MVP; placeholder for future mappings
-    tau_b=float(tau_b),
-    f_r=float(f_r),
-    tau_v=float(tau_v),
-    v_rd=float(v_rd),
+# _design_input() arguments, cast once; also the cache key of _cached_check,
+# _cached_sweep and _sweep_png. Keep it primitives only (floats, enum member
+# names): Streamlit hashes those directly, whereas a DesignInput or enum member
+# would go through its slower pickle-based fallback hasher on every rerun.
+inputs = (
+    float(s), float(t), float(c), float(gamma_rock),
+    load_model.name, geology.name, float(theta), float(h_block),
+    float(tau_b), float(f_r), float(tau_v), float(v_rd),
+    mode.name, float(phi_flex), float(phi_shear), float(phi_punch),
+    float(gamma_load), float(t_dur), float(a_bond),
 )
 
-factors = CodeFactors(
-    mode=mode,
-    phi_flexure=float(phi_flex),
-    phi_shear=float(phi_shear),
-    phi_punching=float(phi_punch),
-    gamma_load=float(gamma_load),
-    t_dur_deduction=float(t_dur),
-)
+# Keep showing results after the first Calculate, so reruns from the widgets
+# below (e.g. the spacing sweep) do not hide them again
+if run_calc:
+    st.session_state["calculated"] = True
 
-inp = DesignInput(
-    s=float(s),
-    t=float(t),
-    c=float(c),
-    gamma_rock=float(gamma_rock),
-    load_model=load_model,
-    geology_preset=geology,
-    theta_deg=float(theta),
-    h_block=float(h_block),
-    materials=materials,
-    factors=factors,
-    age_label="User-set",
-    notes="MVP run",
-    a_bond=float(a_bond),
-)
+if st.session_state.get("calculated", False):
+    import pandas as pd
 
-if run_calc:
-    result = check_design(inp)
+    result = _cached_check(*inputs)
 
     col1, col2 = st.columns((1, 1), gap="large")
 
     with col1:
         st.subheader("Per-mode checks")
-        rows = []
-        for name, mr in result.modes.items():
-            rows.append({
-                "Mode": name,
-                "Demand": mr.demand,
-                "Capacity": mr.capacity,
-                "FoS": mr.fos if mr.fos is not None else "",
-                "Utilisation": mr.utilization if mr.utilization is not None else "",
-                "Pass": "Yes" if (mr.passes is True) else ("No" if (mr.passes is False) else ""),
-                "Detail": mr.detail,
-            })
-        df = pd.DataFrame(rows)
-        st.dataframe(df, use_container_width=True)
+        df = pd.DataFrame(result["modes"])
+        # Plain Arrow table: numbers are formatted by the frontend (no Styler,
+        # no pre-formatted strings), NaN shows as an empty cell
+        st.dataframe(
+            df,
+            width="stretch",
+            hide_index=True,
+            column_config=_RESULTS_COLUMN_CONFIG,
+        )
 
         st.caption(
-            f"Derived: t_eff = {result.derived.get('t_eff', float('nan')):.3f} m, "
-            f"W_total = {result.derived.get('W_total_kN', float('nan')):.2f} kN, "
-            f"w = {result.derived.get('w_kNpm2', float('nan')):.2f} kN/m²"
+            f"Derived: t_eff = {result['derived'].get('t_eff', float('nan')):.3f} m, "
+            f"W_total = {result['derived'].get('W_total_kN', float('nan')):.2f} kN, "
+            f"w = {result['derived'].get('w_kNpm2', float('nan')):.2f} kN/m²"
         )
 
     with col2:
         st.subheader("Governing outcome")
         if mode == DesignMode.FOS:
             st.metric(
-                label=f"Governing mode (FoS ≥ 1.0): {result.governing_mode}",
-                value=f"{result.governing_value:.3f}",
-                delta="OK" if result.ok else "NOT OK",
-                delta_color="normal" if result.ok else "inverse",
+                label=f"Governing mode (FoS ≥ 1.0): {result['governing_mode']}",
+                value=f"{result['governing_value']:.3f}",
+                delta="OK" if result["ok"] else "NOT OK",
+                delta_color="normal" if result["ok"] else "inverse",
             )
         else:
             st.metric(
-                label=f"Governing mode (Utilisation ≤ 1.0): {result.governing_mode}",
-                value=f"{result.governing_value:.3f}",
-                delta="OK" if result.ok else "NOT OK",
-                delta_color="normal" if result.ok else "inverse",
+                label=f"Governing mode (Utilisation ≤ 1.0): {result['governing_mode']}",
+                value=f"{result['governing_value']:.3f}",
+                delta="OK" if result["ok"] else "NOT OK",
+                delta_color="normal" if result["ok"] else "inverse",
             )
 
         # Optional spacing sweep
         st.markdown("### Spacing sweep (quick stability chart)")
         sweep = st.checkbox("Enable spacing sweep")
         if sweep:
-            s_min = st.number_input("s_min (m)", min_value=0.5, max_value=float(s), value=0.8, step=0.1)
-            s_max = st.number_input("s_max (m)", min_value=float(s), max_value=5.0, value=max(float(s), 3.0), step=0.1)
+            # float/int widget arguments, so these already return float/int
+            s_min = st.number_input("s_min (m)", min_value=0.5, max_value=s, value=0.8, step=0.1)
+            s_max = st.number_input("s_max (m)", min_value=s, max_value=5.0, value=max(s, 3.0), step=0.1)
             npts = st.slider("Points", min_value=5, max_value=50, value=20, step=1)
 
-            s_vals = np.linspace(float(s_min), float(s_max), int(npts))
-            y_vals = []
-            labels = []
-
-            for s_try in s_vals:
-                inp_s = DesignInput(**{**asdict(inp), "s": float(s_try)})
-                res_s = check_design(inp_s)
-                # Plot governing value: FoS (want ≥1) or Utilisation (want ≤1)
-                y = res_s.governing_value
-                y_vals.append(y)
-
-            fig, ax = plt.subplots()
-            ax.plot(s_vals, y_vals, linewidth=2)
-            ax.set_xlabel("Bolt spacing s (m)")
-            ax.set_ylabel("FoS (if FoS mode)  or  Utilisation (if LRFD)")
-            ax.grid(True, which="both")
-            st.pyplot(fig, clear_figure=True)
+            # Governing value per spacing: FoS (want ≥1) or Utilisation (want ≤1)
+            st.image(_sweep_png(s_min, s_max, npts, *inputs), width="stretch")
+            if mode == DesignMode.LRFD:
+                st.caption(f"Utilisation is shown clipped at {_UTIL_DISPLAY_MAX:g} (display only).")
 
     st.divider()
     st.caption("This MVP uses simple plate-strip flexure with a two-way factor and pragmatic punching/adhesion models. Refine coefficients per project codes/tests.")
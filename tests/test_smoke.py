@@ -5,22 +5,34 @@
 #
 from __future__ import annotations
 
+import io
 import math
+import subprocess
+import sys
+import zipfile
+from dataclasses import FrozenInstanceError, replace
+from pathlib import Path
 
+import numpy as np
+import pytest
+
+from core import _loads_fast, loads
+from core._jit import HAVE_NUMBA
 from core.models import (
     DesignInput, MaterialProps, CodeFactors,
-    DesignMode, LoadModel, GeologyPreset
+    DesignMode, LoadModel, GeologyPreset, MODE_NAMES, ModeIdx
 )
-from core.design import check_design
+from core.design import build_sweep, check_design, check_design_grid, check_design_sweep
+from core.loads import compute_panel_load, make_panel_load_fn
+from export.excel import export_many_to_excel_bytes, export_to_excel_bytes, export_to_excel_file
 
 
-def _default_input(
-    s: float = 1.5,
-    t: float = 0.10,
-    c: float = 0.25,
-    gamma_rock: float = 25.0,
-    load_model: LoadModel = LoadModel.PYRAMID_60,
-) -> DesignInput:
+@pytest.fixture(scope="module")
+def base_input() -> DesignInput:
+    """
+    Shared default input, built once per module. Tests must not mutate it:
+    derive variants with dataclasses.replace (or _with_factors).
+    """
     mats = MaterialProps(
         f_c=30.0,
         tau_b=1.0,  # MPa
@@ -37,11 +49,11 @@ def _default_input(
         t_dur_deduction=0.0,
     )
     return DesignInput(
-        s=s,
-        t=t,
-        c=c,
-        gamma_rock=gamma_rock,
-        load_model=load_model,
+        s=1.5,
+        t=0.10,
+        c=0.25,
+        gamma_rock=25.0,
+        load_model=LoadModel.PYRAMID_60,
         geology_preset=GeologyPreset.GENERIC,
         theta_deg=60.0,
         h_block=0.6,
@@ -53,25 +65,29 @@ def _default_input(
     )
 
 
-def test_design_runs_and_has_modes():
+def _with_factors(inp: DesignInput, **changes) -> DesignInput:
+    """Copy of 'inp' with some CodeFactors fields replaced."""
+    return replace(inp, factors=replace(inp.factors, **changes))
+
+
+def test_design_runs_and_has_modes(base_input):
     """Basic: engine returns four modes with sensible numbers."""
-    inp = _default_input()
-    res = check_design(inp)
+    res = check_design(base_input)
     assert res.modes, "No modes returned"
     for key in ("Adhesion", "Flexure", "Punching", "DirectShear"):
-        assert key in res.modes, f"Missing mode {key}"
-        mr = res.modes[key]
+        assert key in res.modes_dict, f"Missing mode {key}"
+        mr = res.modes_dict[key]
         assert mr.capacity >= 0.0
         assert mr.demand >= 0.0
 
 
-def test_spacing_increase_reduces_margins_fos():
+def test_spacing_increase_reduces_margins_fos(base_input):
     """
     As spacing increases, demands rise faster than capacities for most modes,
     so the governing FoS should not increase.
     """
-    inp1 = _default_input(s=1.2)
-    inp2 = _default_input(s=2.4)
+    inp1 = replace(base_input, s=1.2)
+    inp2 = replace(base_input, s=2.4)
     res1 = check_design(inp1)
     res2 = check_design(inp2)
 
@@ -81,39 +97,186 @@ def test_spacing_increase_reduces_margins_fos():
     )
 
 
-def test_thicker_shotcrete_increases_flexural_capacity():
+def test_thicker_shotcrete_increases_flexural_capacity(base_input):
     """Flexural capacity should increase with thickness (t_eff^2)."""
-    inp_thin = _default_input(t=0.08)
-    inp_thick = _default_input(t=0.14)
+    inp_thin = replace(base_input, t=0.08)
+    inp_thick = replace(base_input, t=0.14)
     res_thin = check_design(inp_thin)
     res_thick = check_design(inp_thick)
 
-    M_thin = res_thin.modes["Flexure"].capacity
-    M_thick = res_thick.modes["Flexure"].capacity
+    M_thin = res_thin.modes[ModeIdx.FLEXURE].capacity
+    M_thick = res_thick.modes[ModeIdx.FLEXURE].capacity
     assert M_thick > M_thin
 
 
-def test_lrfd_utilisation_switch():
+def test_lrfd_utilisation_switch(base_input):
     """Switching to LRFD should populate utilisation and still produce a governing value."""
-    inp = _default_input()
-    inp.factors.mode = DesignMode.LRFD
-    res = check_design(inp)
+    res = check_design(_with_factors(base_input, mode=DesignMode.LRFD))
 
     # At least one mode must have a utilisation value
-    assert any(mr.utilization is not None for mr in res.modes.values())
+    assert any(mr.utilization is not None for mr in res.modes)
     # Governing value should be > 0
     assert res.governing_value > 0.0
 
 
-def test_durability_deduction_reduces_capacity():
+def test_durability_deduction_reduces_capacity(base_input):
     """Durability deduction lowers effective thickness and hence flexural capacity."""
-    inp0 = _default_input(t=0.12)
+    inp0 = replace(base_input, t=0.12)
     res0 = check_design(inp0)
 
-    inp1 = _default_input(t=0.12)
-    inp1.factors.t_dur_deduction = 0.02  # 20 mm off
+    inp1 = _with_factors(inp0, t_dur_deduction=0.02)  # 20 mm off
     res1 = check_design(inp1)
 
-    M0 = res0.modes["Flexure"].capacity
-    M1 = res1.modes["Flexure"].capacity
+    M0 = res0.modes[ModeIdx.FLEXURE].capacity
+    M1 = res1.modes[ModeIdx.FLEXURE].capacity
     assert M1 < M0
+
+
+def test_sweep_matches_pointwise_check_design(base_input):
+    """Vectorised spacing sweep reproduces check_design at each spacing."""
+    s_vals = np.linspace(0.8, 3.0, 12)
+    for load_model in LoadModel:
+        for mode in DesignMode:
+            inp = _with_factors(replace(base_input, load_model=load_model), mode=mode)
+            sweep = check_design_sweep(inp, s_vals)
+            for i, s_try in enumerate(s_vals):
+                res = check_design(replace(inp, s=float(s_try)))
+                assert math.isclose(sweep["governing"][i], res.governing_value, rel_tol=1e-12)
+                assert sweep["governing_mode"][i] == res.governing_mode
+                for name, mr in zip(MODE_NAMES, res.modes):
+                    expected = mr.fos if mode == DesignMode.FOS else mr.utilization
+                    assert math.isclose(sweep["per_mode"][name][i], expected, rel_tol=1e-12)
+
+
+def test_grid_matches_pointwise_check_design(base_input):
+    """(s, t) grid evaluation reproduces check_design in every cell."""
+    s_vals = np.linspace(0.8, 3.0, 5)
+    t_vals = np.linspace(0.03, 0.20, 4)
+    for mode in DesignMode:
+        inp = _with_factors(base_input, mode=mode, t_dur_deduction=0.04)  # first column has t_eff = 0
+        grid = check_design_grid(s_vals, t_vals, inp)
+        assert grid["governing"].shape == (len(s_vals), len(t_vals))
+        for i, s_try in enumerate(s_vals):
+            for j, t_try in enumerate(t_vals):
+                res = check_design(replace(inp, s=float(s_try), t=float(t_try)))
+                assert math.isclose(grid["governing"][i, j], res.governing_value, rel_tol=1e-12)
+                assert grid["mode_names"][grid["governing_idx"][i, j]] == res.governing_mode
+
+
+def test_build_sweep_matches_check_design_sweep(base_input):
+    """Specialised sweep kernel returns the same arrays as check_design_sweep."""
+    s_vals = np.linspace(0.8, 3.0, 12)
+    for mode in DesignMode:
+        inp = _with_factors(replace(base_input, load_model=LoadModel.FLAT_BLOCK), mode=mode)
+        sweep = build_sweep(inp)
+        if HAVE_NUMBA:
+            assert build_sweep(inp) is sweep  # compiled kernel is reused
+        got, expected = sweep(s_vals), check_design_sweep(inp, s_vals)
+        assert np.array_equal(got["governing_mode"], expected["governing_mode"])
+        for key in ("governing", "W_total_kN", "w_kNpm2"):
+            assert np.allclose(got[key], expected[key], rtol=1e-12)
+
+
+def test_sweep_from_worker_thread_exits_cleanly():
+    """A UI-sized sweep run off the main thread (as Streamlit does) must not block interpreter exit."""
+    script = (
+        "import threading\n"
+        "import numpy as np\n"
+        "from core.models import DesignInput\n"
+        "from core.design import check_design_sweep\n"
+        "inp = DesignInput(s=1.5, t=0.1, c=0.25, gamma_rock=25.0)\n"
+        "t = threading.Thread(target=check_design_sweep, args=(inp, np.linspace(0.8, 3.0, 20)))\n"
+        "t.start()\n"
+        "t.join()\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr.decode()
+
+
+def test_vectorised_block_weights_match_scalar():
+    """*_vec and compiled load models agree with the scalar functions, surcharges included."""
+    s_vals = np.linspace(0.5, 3.0, 7)
+    extra = dict(surcharge_uniform=2.0, include_shotcrete_self_weight=True, t_shotcrete=0.1)
+    # The pyramid kernel takes tan(theta) in place of theta_deg
+    cases = (
+        (loads.block_weight_pyramid, loads.block_weight_pyramid_vec,
+         _loads_fast.block_weight_pyramid_kernel, (25.0, 60.0), (25.0, math.tan(math.radians(60.0)))),
+        (loads.block_weight_flat, loads.block_weight_flat_vec,
+         _loads_fast.block_weight_flat_kernel, (25.0, 0.6), (25.0, 0.6)),
+        (loads.block_weight_shale, loads.block_weight_shale_vec,
+         _loads_fast.block_weight_pyramid_kernel, (25.0, 50.0), (25.0, math.tan(math.radians(50.0)))),
+    )
+    for scalar_fn, vec_fn, kernel, args, kernel_args in cases:
+        W_vec, w_vec = vec_fn(s_vals, *args, **extra)
+        for i, s_try in enumerate(s_vals):
+            W, w = scalar_fn(float(s_try), *args, **extra)
+            W_k, w_k = kernel(float(s_try), *kernel_args, 2.0, True, 0.1, 24.0)
+            assert math.isclose(W_vec[i], W, rel_tol=1e-12)
+            assert math.isclose(w_vec[i], w, rel_tol=1e-12)
+            assert math.isclose(W_k, W, rel_tol=1e-12) and math.isclose(w_k, w, rel_tol=1e-12)
+
+    out = np.empty((s_vals.size, 2))
+    for into_fn, vec_fn, args in ((loads.block_weight_pyramid_into, loads.block_weight_pyramid_vec, (25.0, 60.0)),
+                                  (loads.block_weight_flat_into, loads.block_weight_flat_vec, (25.0, 0.6))):
+        into_fn(out, s_vals, *args, **extra)
+        W_vec, w_vec = vec_fn(s_vals, *args, **extra)
+        assert np.allclose(out[:, 0], W_vec, rtol=1e-12) and np.allclose(out[:, 1], w_vec, rtol=1e-12)
+
+
+def test_make_panel_load_fn_matches_compute_panel_load():
+    """The specialised panel-load closure agrees with compute_panel_load."""
+    extra = dict(gamma_rock=25.0, theta_deg=50.0, h_block=0.6, surcharge_uniform=2.0,
+                 include_shotcrete_self_weight=True, t_shotcrete=0.1)
+    for model in ("Pyramid60", "flat", LoadModel.SHALE_WEDGE):
+        panel_load = make_panel_load_fn(model, **extra)
+        for s_try in (0.5, 1.2, 2.75):
+            W, w = compute_panel_load(model, s_try, **extra)
+            W_f, w_f = panel_load(s_try)
+            assert math.isclose(W_f, W, rel_tol=1e-12) and math.isclose(w_f, w, rel_tol=1e-12)
+
+
+def test_excel_export_writes_all_sheets(base_input, tmp_path):
+    """Workbook export (in memory and streamed to disk) has every sheet, in both modes."""
+    sweep = ([1.0, 1.5, 2.0], [2.0, 1.4, 1.0])
+    scenarios = []
+    for mode in DesignMode:
+        inp = _with_factors(base_input, mode=mode)
+        res = check_design(inp)
+        scenarios.append((inp, res))
+        path = tmp_path / f"{mode.value}.xlsx"
+        export_to_excel_file(str(path), inp, res, spacing_sweep=sweep)
+        for source in (io.BytesIO(export_to_excel_bytes(inp, res, spacing_sweep=sweep)), path):
+            with zipfile.ZipFile(source) as zf:
+                workbook_xml = zf.read("xl/workbook.xml").decode("utf-8")
+            for sheet in ("Summary", "Inputs", "Results", "Derived", "SpacingSweep"):
+                assert f'name="{sheet}"' in workbook_xml
+
+    with zipfile.ZipFile(io.BytesIO(export_many_to_excel_bytes(scenarios))) as zf:
+        workbook_xml = zf.read("xl/workbook.xml").decode("utf-8")
+    for i in range(1, len(scenarios) + 1):
+        for sheet in ("Summary", "Inputs", "Results", "Derived"):
+            assert f'name="{i}_{sheet}"' in workbook_xml
+
+
+def test_t_effective_follows_replace(base_input):
+    """t_effective is derived on construction, so replace() keeps it in step."""
+    assert math.isclose(base_input.t_effective, 0.10)
+    inp = replace(base_input, t=0.15)
+    assert math.isclose(inp.t_effective, 0.15)
+    inp = _with_factors(inp, t_dur_deduction=0.05)
+    assert math.isclose(inp.t_effective, 0.10)
+    assert hash(inp) == hash(replace(inp))  # frozen: usable as a cache key
+
+
+def test_design_input_validates_geometry(base_input):
+    """Invalid geometry is rejected on construction; instances are frozen."""
+    for name, bad in (("s", 0.0), ("t", -0.01), ("gamma_rock", 0.0), ("theta_deg", 90.0), ("h_block", 0.0)):
+        with pytest.raises(ValueError):
+            replace(base_input, **{name: bad})
+    with pytest.raises(FrozenInstanceError):
+        base_input.s = 2.0